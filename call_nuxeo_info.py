@@ -10,15 +10,32 @@ import argparse
 import json
 import requests
 import sys
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 
-def call_info_via_http(port: int = 8123, host: str = "localhost") -> Dict[str, Any]:
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def call_info_via_http(
+    port: int = 8123, host: str = "localhost", timeout: float = 30.0
+) -> Dict[str, Any]:
     """
     Call the nuxeo://info resource via HTTP.
     
     Args:
         port: The HTTP port of the MCP server
         host: The hostname of the MCP server
+        timeout: Request timeout in seconds
         
     Returns:
         The response from the nuxeo://info resource
@@ -27,39 +44,55 @@ def call_info_via_http(port: int = 8123, host: str = "localhost") -> Dict[str, A
     print(f"Calling {url}...")
     
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=timeout)
         response.raise_for_status()  # Raise an exception for 4XX/5XX responses
         return response.json()
     except requests.exceptions.RequestException as e:
         print(f"Error calling nuxeo://info via HTTP: {e}")
         return {"error": str(e)}
 
+@lru_cache(maxsize=1)
+def _get_server() -> Any:
+    """
+    Create the MCP server instance once per process.
+    
+    Returns:
+        The NuxeoMCPServer instance
+    """
+    # Import the server module
+    from nuxeo_mcp.server import NuxeoMCPServer
+    
+    return NuxeoMCPServer()
+
+@lru_cache(maxsize=1)
+def _resource_map() -> Dict[str, Any]:
+    """
+    Index the server's resources by URI once per process.
+    
+    Returns:
+        The registered resources, keyed by URI
+    """
+    return {resource.uri: resource for resource in _get_server().mcp.list_resources()}
+
 def call_info_via_import() -> Optional[Dict[str, Any]]:
     """
     Call the nuxeo://info resource via direct Python import.
     
+    The server instance and the resource index are memoized, so repeated
+    calls within a process skip re-discovery.
+    
     Returns:
         The response from the nuxeo://info resource, or None if an error occurs
     """
     try:
-        # Import the server module
-        from nuxeo_mcp.server import NuxeoMCPServer
-        
-        # Create a server instance
-        server = NuxeoMCPServer()
-        
-        # Get the resources
-        resources = server.mcp.list_resources()
-        
-        # Find the nuxeo://info resource
-        for resource in resources:
-            if resource.uri == "nuxeo://info":
-                # Call the resource
-                # Note: This is a simplified approach and may not work exactly like this
-                # in a real implementation, as we'd need to access the actual function
-                # that implements the resource
-                print("Found nuxeo://info resource, but direct calling is not implemented")
-                return None
+        resource = _resource_map().get("nuxeo://info")
+        if resource is not None:
+            # Call the resource
+            # Note: This is a simplified approach and may not work exactly like this
+            # in a real implementation, as we'd need to access the actual function
+            # that implements the resource
+            print("Found nuxeo://info resource, but direct calling is not implemented")
+            return None
         
         print("nuxeo://info resource not found")
         return None
@@ -92,7 +125,12 @@ def main() -> None:
     
     # Print the result
     print("\nResult from nuxeo://info resource:")
-    print(json.dumps(result, indent=2))
+    if ORJSON_AVAILABLE:
+        # orjson encodes straight to UTF-8 bytes, skipping the str round-trip
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        print(json.dumps(result, indent=2))
 
 if __name__ == "__main__":
     main()
@@ -7,46 +7,109 @@ A command-line client for interacting with the Nuxeo MCP Server using the FastMC
 
 import argparse
 import asyncio
-from collections.abc import Iterable
+import atexit
+from collections.abc import AsyncIterator, Coroutine, Iterable
+import concurrent.futures
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import json
 import sys
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 from mcp.types import TextContent
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from fastmcp import Client
 
 
-async def search(
-    url: str,
-    query: str,
-    page_size: int = 20,
-    page_index: int = 0,
-    content_type: str = "text/markdown",
-) -> dict[str, Any]:
+def _dumps_indented(data: Any) -> str:
     """
-    Search for documents using the search tool.
+    Serialize data as indented JSON, using orjson when it is installed.
+    
+    Args:
+        data: The data to serialize
+        
+    Returns:
+        The JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=8)
+def _normalize_url(url: str) -> str:
+    """
+    Ensure the URL includes the /mcp path if it's not already there.
     
     Args:
         url: The URL of the MCP server
-        query: The NXQL query to execute
-        page_size: Number of results per page
-        page_index: Page index
         
     Returns:
-        The search results
+        The URL of the MCP endpoint
     """
-    try:
-        # Ensure the URL includes the /mcp path if it's not already there
-        mcp_url = url
-        if not url.endswith('/mcp') and '/mcp' not in url:
-            mcp_url = f"{url}/mcp"
+    return url if '/mcp' in url else f"{url}/mcp"
+
+
+class MCPClientWrapper:
+    """
+    Long-lived wrapper around a FastMCP client.
+    
+    The MCP session is initialized once when the wrapper is entered and reused
+    for every tool call, instead of paying the initialize handshake per call.
+    
+    Usage:
+        async with MCPClientWrapper(url) as client:
+            await client.search("SELECT * FROM Document")
+            await client.get_document(path="/default-domain")
+    """
+
+    def __init__(self, url: str) -> None:
+        """
+        Initialize the wrapper.
         
-        print(f"Connecting to MCP server at: {mcp_url}")
-        client = Client(mcp_url)
+        Args:
+            url: The URL of the MCP server
+        """
+        self.url = _normalize_url(url)
+        self._client = Client(self.url)
+
+    async def __aenter__(self) -> "MCPClientWrapper":
+        print(f"Connecting to MCP server at: {self.url}")
+        await self._client.__aenter__()
+        print("Connected successfully")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._client.__aexit__(*exc_info)
+
+    async def search(
+        self,
+        query: str,
+        page_size: int = 20,
+        page_index: int = 0,
+        content_type: str = "text/markdown",
+    ) -> dict[str, Any]:
+        """
+        Search for documents using the search tool.
         
-        async with client:
-            print("Connected successfully, calling search tool...")
-            result = await client.call_tool(
+        Args:
+            query: The NXQL query to execute
+            page_size: Number of results per page
+            page_index: Page index
+            content_type: The format of the output
+            
+        Returns:
+            The search results
+        """
+        try:
+            print("Calling search tool...")
+            result = await self._client.call_tool(
                 "search",
                 {
                     "content_type": content_type,
@@ -57,16 +120,232 @@ async def search(
             )
             match content_type:
                 case "application/json":
-                    return json.dumps(result.structured_content, indent=2)
+                    return _dumps_indented(result.structured_content)
                 case "text/markdown":
                     return result.structured_content["content"][0]
                 case _:
                     return result
 
+        except Exception as e:
+            print(f"Error in search: {e}")
+            print(f"Error type: {type(e)}")
+            raise
+
+    async def get_document(self, path: Optional[str] = None, uid: Optional[str] = None, 
+                           fetch_blob: bool = False, conversion_format: Optional[str] = None, 
+                           rendition: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get a document by path or ID.
+        
+        Args:
+            path: The path of the document
+            uid: The UID of the document
+            fetch_blob: Whether to fetch the document's blob
+            conversion_format: Format to convert the document to
+            rendition: Rendition to fetch
+            
+        Returns:
+            The document
+        """
+        if not path and not uid:
+            raise ValueError("Either path or uid must be provided")
+        
+        arguments = {}
+        # Use ref parameter instead of path/uid
+        if path:
+            arguments["ref"] = path
+        elif uid:
+            arguments["ref"] = uid
+        
+        if fetch_blob:
+            arguments["fetch_blob"] = fetch_blob
+        if conversion_format:
+            arguments["conversion_format"] = conversion_format
+        if rendition:
+            arguments["rendition"] = rendition
+        
+        try:
+            print("Calling get_document tool...")
+            result = await self._client.call_tool("get_document", arguments)
+
+            if isinstance(result, Iterable):
+                # Return the first text content, if any
+                text = next(
+                    (content.text for content in result if isinstance(content, TextContent)),
+                    None,
+                )
+                if text is not None:
+                    return text
+
+            return result
+
+        except Exception as e:
+            print(f"Error in get_document: {e}")
+            print(f"Error type: {type(e)}")
+            raise
+
+
+class AsyncLoopThread(threading.Thread):
+    """
+    Background thread running a single asyncio event loop forever.
+    
+    Coroutines are submitted from synchronous code with submit(), so MCP
+    sessions opened on this loop stay usable across calls instead of being
+    torn down with each asyncio.run().
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="mcp-client-loop", daemon=True)
+        self.loop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the background loop.
+        
+        Args:
+            coro: The coroutine to run
+            
+        Returns:
+            A future resolving to the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for the thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+        self.loop.close()
+
+
+_loop_thread: Optional[AsyncLoopThread] = None
+_loop_lock = threading.Lock()
+
+# Open MCP sessions, keyed by normalized MCP URL; only used from the background loop
+_clients: Dict[str, MCPClientWrapper] = {}
+
+
+def _get_loop_thread() -> AsyncLoopThread:
+    """Start the background loop on first use."""
+    global _loop_thread
+    with _loop_lock:
+        if _loop_thread is None:
+            _loop_thread = AsyncLoopThread()
+            _loop_thread.start()
+            atexit.register(_shutdown)
+        return _loop_thread
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    return _get_loop_thread().submit(coro).result()
+
+
+async def get_client(url: str) -> MCPClientWrapper:
+    """
+    Get the shared MCP session for a server, opening it on first use.
+    
+    Must be awaited on the shared background loop (see run_sync), which owns
+    the cached sessions.
+    
+    Args:
+        url: The URL of the MCP server
+        
+    Returns:
+        The connected client wrapper
+        
+    Raises:
+        RuntimeError: If awaited on any other event loop
+    """
+    if not _on_shared_loop():
+        raise RuntimeError("get_client() must run on the shared loop, use run_sync()")
+    mcp_url = _normalize_url(url)
+    client = _clients.get(mcp_url)
+    if client is None:
+        client = await MCPClientWrapper(mcp_url).__aenter__()
+        _clients[mcp_url] = client
+    return client
+
+
+def _on_shared_loop() -> bool:
+    """Tell whether the caller runs on the shared background loop."""
+    return _loop_thread is not None and asyncio.get_running_loop() is _loop_thread.loop
+
+
+@asynccontextmanager
+async def _session(url: str) -> AsyncIterator[MCPClientWrapper]:
+    """
+    Provide an MCP session for a server.
+    
+    On the shared background loop the cached session is reused; on any other
+    loop, such as one started by asyncio.run(), a session is opened for this
+    call only and closed afterwards.
+    
+    Args:
+        url: The URL of the MCP server
+        
+    Yields:
+        The connected client wrapper
+    """
+    if _on_shared_loop():
+        yield await get_client(url)
+    else:
+        async with MCPClientWrapper(url) as client:
+            yield client
+
+
+async def _close_clients() -> None:
+    """Close every open MCP session."""
+    while _clients:
+        _, client = _clients.popitem()
+        await client.__aexit__(None, None, None)
+
+
+def _shutdown() -> None:
+    """Close the shared sessions and stop the background loop at exit."""
+    global _loop_thread
+    if _loop_thread is None:
+        return
+    try:
+        _loop_thread.submit(_close_clients()).result(timeout=10)
     except Exception as e:
-        print(f"Error in search: {e}")
-        print(f"Error type: {type(e)}")
-        raise
+        print(f"Error closing MCP sessions: {e}")
+    _loop_thread.stop()
+    _loop_thread = None
+
+
+async def search(
+    url: str,
+    query: str,
+    page_size: int = 20,
+    page_index: int = 0,
+    content_type: str = "text/markdown",
+) -> dict[str, Any]:
+    """
+    Search for documents using the search tool.
+    
+    Args:
+        url: The URL of the MCP server
+        query: The NXQL query to execute
+        page_size: Number of results per page
+        page_index: Page index
+        
+    Returns:
+        The search results
+    """
+    async with _session(url) as client:
+        return await client.search(query, page_size, page_index, content_type)
 
 
 async def get_document(url: str, path: Optional[str] = None, uid: Optional[str] = None, 
@@ -89,58 +368,107 @@ async def get_document(url: str, path: Optional[str] = None, uid: Optional[str]
     if not path and not uid:
         raise ValueError("Either path or uid must be provided")
     
-    arguments = {}
-    # Use ref parameter instead of path/uid
-    if path:
-        arguments["ref"] = path
-    elif uid:
-        arguments["ref"] = uid
-    
-    if fetch_blob:
-        arguments["fetch_blob"] = fetch_blob
-    if conversion_format:
-        arguments["conversion_format"] = conversion_format
-    if rendition:
-        arguments["rendition"] = rendition
+    async with _session(url) as client:
+        return await client.get_document(
+            path, uid, fetch_blob, conversion_format, rendition
+        )
+
+
+def _read_lines(file_path: str) -> List[str]:
+    """
+    Read the non-empty lines of a file.
     
-    try:
-        # Ensure the URL includes the /mcp path if it's not already there
-        mcp_url = url
-        if not url.endswith('/mcp') and '/mcp' not in url:
-            mcp_url = f"{url}/mcp"
+    Args:
+        file_path: Path of the file to read
         
-        print(f"Connecting to MCP server at: {mcp_url}")
-        client = Client(mcp_url)
+    Returns:
+        The stripped, non-empty lines of the file
+    """
+    with open(file_path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def search_many(
+    url: str,
+    queries: List[str],
+    page_size: int = 20,
+    page_index: int = 0,
+    content_type: str = "text/markdown",
+    max_concurrent: int = 4,
+) -> List[Any]:
+    """
+    Run several searches concurrently over a single MCP session.
+    
+    Args:
+        url: The URL of the MCP server
+        queries: The NXQL queries to execute
+        page_size: Number of results per page
+        page_index: Page index
+        content_type: The format of the output
+        max_concurrent: Maximum number of tool calls in flight at once
         
-        async with client:
-            print("Connected successfully, calling get_document tool...")
-            result = await client.call_tool("get_document", arguments)
+    Returns:
+        The search results, in the same order as the queries
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-            if isinstance(result, Iterable):
-                for content in result:
-                    if type(content) == TextContent:
-                        return content.text
-                    else:
-                        print(f"#### Unhandled Content Type {type(content)} ")
+    async with _session(url) as client:
 
-            return result
+        async def bounded_search(query: str) -> Any:
+            async with semaphore:
+                return await client.search(query, page_size, page_index, content_type)
+
+        return await asyncio.gather(*(bounded_search(query) for query in queries))
+
+
+async def get_documents(
+    url: str,
+    refs: List[str],
+    fetch_blob: bool = False,
+    conversion_format: Optional[str] = None,
+    rendition: Optional[str] = None,
+    max_concurrent: int = 4,
+) -> List[Any]:
+    """
+    Fetch several documents concurrently over a single MCP session.
+    
+    Args:
+        url: The URL of the MCP server
+        refs: Paths (starting with '/') or UIDs of the documents
+        fetch_blob: Whether to fetch the documents' blobs
+        conversion_format: Format to convert the documents to
+        rendition: Rendition to fetch
+        max_concurrent: Maximum number of tool calls in flight at once
         
+    Returns:
+        The documents, in the same order as the refs
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-    except Exception as e:
-        print(f"Error in get_document: {e}")
-        print(f"Error type: {type(e)}")
-        raise
+    async with _session(url) as client:
+
+        async def bounded_get(ref: str) -> Any:
+            path, uid = (ref, None) if ref.startswith("/") else (None, ref)
+            async with semaphore:
+                return await client.get_document(
+                    path, uid, fetch_blob, conversion_format, rendition
+                )
+
+        return await asyncio.gather(*(bounded_get(ref) for ref in refs))
 
 
 def main():
     parser = argparse.ArgumentParser(description="Nuxeo MCP Client")
     parser.add_argument("--url", default="http://localhost:8080", help="URL of the MCP server")
+    parser.add_argument("--max-concurrent", type=int, default=4,
+                        help="Maximum number of concurrent tool calls in batch mode")
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
     # Search command
     search_parser = subparsers.add_parser("search", help="Search for documents")
-    search_parser.add_argument("query", help="NXQL query")
+    search_parser.add_argument("query", nargs="?", help="NXQL query")
+    search_parser.add_argument("--queries-file", help="File with one NXQL query per line")
     search_parser.add_argument("--page-size", type=int, default=20, help="Number of results per page")
     search_parser.add_argument("--page-index", type=int, default=0, help="Page index")
     search_parser.add_argument(
@@ -156,12 +484,28 @@ def main():
     get_doc_parser.add_argument("--fetch-blob", action="store_true", help="Fetch the document's blob")
     get_doc_parser.add_argument("--conversion-format", help="Format to convert the document to")
     get_doc_parser.add_argument("--rendition", help="Rendition to fetch")
+    get_doc_parser.add_argument("--refs-file", help="File with one document path or UID per line")
     
     args = parser.parse_args()
     
-    if args.command == "search":
+    if args.command == "search" and args.queries_file:
+        results = run_sync(
+            search_many(
+                args.url,
+                _read_lines(args.queries_file),
+                args.page_size,
+                args.page_index,
+                args.content_type,
+                args.max_concurrent,
+            )
+        )
+        for result in results:
+            print(result)
+    elif args.command == "search":
+        if not args.query:
+            search_parser.error("either a query or --queries-file is required")
         print(
-            asyncio.run(
+            run_sync(
                 search(
                     args.url,
                     args.query,
@@ -171,9 +515,15 @@ def main():
                 )
             )
         )
+    elif args.command == "get-document" and args.refs_file:
+        results = run_sync(get_documents(args.url, _read_lines(args.refs_file), args.fetch_blob,
+                                         args.conversion_format, args.rendition,
+                                         args.max_concurrent))
+        for result in results:
+            print(result)
     elif args.command == "get-document":
-        result = asyncio.run(get_document(args.url, args.path, args.uid, args.fetch_blob, 
-                                        args.conversion_format, args.rendition))
+        result = run_sync(get_document(args.url, args.path, args.uid, args.fetch_blob, 
+                                       args.conversion_format, args.rendition))
         print(result)
         
     else:
@@ -11,17 +11,18 @@ This script initializes a Nuxeo repository with sample documents for testing:
 
 import os
 import sys
+import asyncio
 import io
 import random
-import tempfile
 import argparse
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Union, List, Tuple
 from nuxeo.client import Nuxeo
-from nuxeo.models import Document, FileBlob
+from requests.adapters import HTTPAdapter
+from nuxeo.models import BufferBlob, Document
 from PIL import Image, ImageDraw
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import LETTER
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +31,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("nuxeo_seed")
 
+# Size of the HTTP connection pool shared by the seeder's concurrent requests
+HTTP_POOL_SIZE = 20
+
+# Chunk size for blob uploads; blobs larger than this are sent in several
+# requests over the pooled connections
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
+
+# US Letter page size in PDF points, used for generated PDFs
+PDF_PAGE_SIZE = (612, 792)
+
 # Sample text for generating random content
 LOREM_IPSUM = """
 Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor 
@@ -40,6 +51,34 @@ pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui offi
 deserunt mollit anim id est laborum.
 """
 
+# Words sampled by get_random_text, split once at import time
+_WORDS = tuple(LOREM_IPSUM.split())
+
+# Words sampled for the lines of generated PDFs
+_PDF_WORDS = (
+    "lorem", "ipsum", "dolor", "sit", "amet", "consectetur",
+    "adipiscing", "elit", "sed", "do", "eiusmod", "tempor"
+)
+
+def _random_word_groups(words: Tuple[str, ...], lengths: List[int]) -> List[str]:
+    """
+    Draw random words for several groups in a single sampling call.
+    
+    Args:
+        words: The words to sample from
+        lengths: Number of words in each group
+        
+    Returns:
+        One space-joined string per group
+    """
+    sample = random.choices(words, k=sum(lengths))
+    groups: List[str] = []
+    start = 0
+    for length in lengths:
+        groups.append(" ".join(sample[start:start + length]))
+        start += length
+    return groups
+
 def generate_random_image(width: int = 400, height: int = 300) -> bytes:
     """
     Generate a PNG image with random shapes and return it as bytes.
@@ -53,17 +92,23 @@ def generate_random_image(width: int = 400, height: int = 300) -> bytes:
     """
     image = Image.new("RGB", (width, height), "white")
     draw = ImageDraw.Draw(image)
+    num_shapes = 20
+
+    # Draw every shape type, coordinate and color up front in bulk
+    shape_types = random.choices(("line", "ellipse", "rectangle"), k=num_shapes)
+    xs = random.choices(range(width + 1), k=2 * num_shapes)
+    ys = random.choices(range(height + 1), k=2 * num_shapes)
+    channels = random.choices(range(256), k=3 * num_shapes)
 
-    for _ in range(20):  # draw 20 random shapes
-        shape_type = random.choice(["line", "ellipse", "rectangle"])
-        x0, y0 = random.randint(0, width), random.randint(0, height)
-        x1, y1 = random.randint(0, width), random.randint(0, height)
+    for i, shape_type in enumerate(shape_types):
+        x0, x1 = xs[2 * i], xs[2 * i + 1]
+        y0, y1 = ys[2 * i], ys[2 * i + 1]
 
         # Ensure (x0, y0) is top-left and (x1, y1) is bottom-right
-        left, right = sorted([x0, x1])
-        top, bottom = sorted([y0, y1])
+        left, right = (x0, x1) if x0 <= x1 else (x1, x0)
+        top, bottom = (y0, y1) if y0 <= y1 else (y1, y0)
 
-        color = tuple(random.randint(0, 255) for _ in range(3))
+        color = tuple(channels[3 * i:3 * i + 3])
 
         if shape_type == "line":
             draw.line((x0, y0, x1, y1), fill=color, width=2)
@@ -72,63 +117,108 @@ def generate_random_image(width: int = 400, height: int = 300) -> bytes:
         elif shape_type == "rectangle":
             draw.rectangle((left, top, right, bottom), outline=color, width=2)
 
+    # Throwaway seed images favour encoding speed over size
     buffer = io.BytesIO()
-    image.save(buffer, format="PNG")
+    image.save(buffer, format="PNG", compress_level=1, optimize=False)
     return buffer.getvalue()
 
 
+def _escape_pdf_text(text: str) -> str:
+    """
+    Escape a string for use as a PDF literal string.
+    
+    Args:
+        text: The text to escape
+        
+    Returns:
+        The text with backslashes and parentheses escaped
+    """
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+@lru_cache(maxsize=1)
+def _pdf_template() -> Tuple[bytes, bytes]:
+    """
+    Build the parts of the generated PDFs that never change.
+    
+    The catalog, page tree, page and font objects are laid out once, with
+    the page content stream as the last object so the fixed objects keep the
+    same offsets in every document.
+    
+    Returns:
+        The file prefix (header and fixed objects) and the xref table
+        entries for those objects
+    """
+    width, height = PDF_PAGE_SIZE
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+            f"/Contents 5 0 R /Resources << /Font << /F1 4 0 R >> >> >>"
+        ).encode("latin-1"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    prefix = bytearray(b"%PDF-1.4\n")
+    xref = bytearray(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 2))
+    for number, body in enumerate(objects, start=1):
+        xref += b"%010d 00000 n \n" % len(prefix)
+        prefix += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    return bytes(prefix), bytes(xref)
+
+
 def generate_random_pdf(num_lines: int = 25) -> bytes:
     """
     Generate a PDF with random text and return it as bytes.
     
+    The document is a minimal single-page PDF assembled by hand: a catalog,
+    a page tree, one page, the standard Helvetica font and the page content
+    stream, followed by the cross-reference table. Only the content stream
+    and the trailing offsets are built per call (see _pdf_template).
+    
     Args:
         num_lines: Number of lines of text to include in the PDF
         
     Returns:
         PDF data as bytes
     """
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=LETTER)
-    width, height = LETTER
-
-    for i in range(num_lines):
-        x = 50
-        y = height - 50 - i * 20
-        text = " ".join(random.choices([
-            "lorem", "ipsum", "dolor", "sit", "amet", "consectetur",
-            "adipiscing", "elit", "sed", "do", "eiusmod", "tempor"
-        ], k=random.randint(5, 10)))
-        c.drawString(x, y, text)
-
-    c.save()
-    return buffer.getvalue()
+    _, height = PDF_PAGE_SIZE
+
+    lengths = [random.randint(5, 10) for _ in range(num_lines)]
+    content = "".join(
+        f"BT /F1 12 Tf 50 {height - 50 - i * 20} Td ({_escape_pdf_text(text)}) Tj ET\n"
+        for i, text in enumerate(_random_word_groups(_PDF_WORDS, lengths))
+    ).encode("latin-1")
 
+    prefix, xref = _pdf_template()
+    content_object = b"5 0 obj\n<< /Length %d >>\nstream\n%sendstream\nendobj\n" % (
+        len(content), content
+    )
+    xref_offset = len(prefix) + len(content_object)
+    return b"".join((
+        prefix,
+        content_object,
+        xref,
+        b"%010d 00000 n \n" % len(prefix),
+        b"trailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % xref_offset,
+    ))
 
-def create_dummy_pdf(content: Optional[str] = None) -> Optional[str]:
+
+def create_dummy_pdf_bytes(content: Optional[str] = None) -> bytes:
     """
-    Create a dummy PDF file with some content.
+    Create a dummy PDF document in memory.
     
     Args:
-        content: Optional content to include in the PDF. If None, default content is used.
+        content: Optional content to include in the PDF. If None, random content is generated.
         
     Returns:
-        Path to the created PDF file, or None if creation failed.
+        PDF data as bytes.
     """
-    # Create a temporary file
-    fd, path = tempfile.mkstemp(suffix=".pdf")
-    try:
-        with os.fdopen(fd, 'wb') as f:
-            if content is None:
-                # Use the new generate_random_pdf function
-                f.write(generate_random_pdf())
-            else:
-                # Legacy support for text content
-                f.write(f"%PDF-1.4\n{content}\n%%EOF".encode('utf-8'))
-        return path
-    except Exception as e:
-        logger.error(f"Error creating dummy PDF: {e}")
-        os.unlink(path)
-        return None
+    if content is None:
+        return generate_random_pdf()
+    # Legacy support for text content
+    return f"%PDF-1.4\n{content}\n%%EOF".encode('utf-8')
 
 def get_random_text(paragraphs: int = 3) -> str:
     """
@@ -140,43 +230,62 @@ def get_random_text(paragraphs: int = 3) -> str:
     Returns:
         Generated random text with the specified number of paragraphs.
     """
-    words = LOREM_IPSUM.split()
-    result: List[str] = []
-    
-    for _ in range(paragraphs):
-        # Generate a paragraph with random length
-        length = random.randint(20, 50)
-        paragraph = " ".join(random.choices(words, k=length))
-        result.append(paragraph)
+    # Generate paragraphs of random length from a single draw
+    lengths = [random.randint(20, 50) for _ in range(paragraphs)]
+    result = _random_word_groups(_WORDS, lengths)
     
     return "\n\n".join(result)
 
-def seed_nuxeo_repository(url: str, username: str, password: str) -> bool:
+def blob_reference(uploaded: Any) -> Dict[str, str]:
     """
-    Seed the Nuxeo repository with sample documents.
+    Build the property value referencing a blob uploaded to a batch.
+    
+    Setting this as ``file:content`` when creating a document attaches the
+    blob server-side, avoiding a separate Blob.AttachOnDocument call.
     
     Args:
-        url: Nuxeo server URL
-        username: Nuxeo username
-        password: Nuxeo password
+        uploaded: The blob returned by a batch upload
         
     Returns:
-        True if seeding was successful, False otherwise.
+        The batch reference for the uploaded blob
     """
-    logger.info(f"Connecting to Nuxeo server at {url}")
-    nuxeo = Nuxeo(
-        host=url,
-        auth=(username, password),
-    )
+    return {
+        "upload-batch": uploaded.batchId,
+        "upload-fileId": str(uploaded.fileIdx),
+    }
+
+def configure_connection_pool(nuxeo: Nuxeo, pool_size: int = HTTP_POOL_SIZE) -> None:
+    """
+    Mount a keep-alive connection pool on the Nuxeo client's HTTP session.
     
-    # Check if connection is successful
-    try:
-        server_info = nuxeo.client.server_info()
-        logger.info(f"Connected to Nuxeo server version: {server_info['productVersion']}")
-    except Exception as e:
-        logger.error(f"Failed to connect to Nuxeo server: {e}")
-        return False
+    The default pool keeps too few connections for the concurrent document
+    creations, so extra connections would be opened and discarded. The
+    client's retry policy is carried over to the new adapters.
     
+    Args:
+        nuxeo: The Nuxeo client to configure
+        pool_size: Maximum number of connections kept per host
+    """
+    session = nuxeo.client._session
+    for prefix in ("http://", "https://"):
+        current = session.get_adapter(prefix)
+        session.mount(prefix, HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=current.max_retries,
+        ))
+
+def _create_folder(nuxeo: Nuxeo) -> Optional[Document]:
+    """
+    Create the folder holding the sample documents.
+    
+    Args:
+        nuxeo: Connected Nuxeo client
+        
+    Returns:
+        The created folder, or None if creation failed.
+    """
     # Create a folder in the root
     folder_name = f"MCP Test Folder {random.randint(1000, 9999)}"
     folder_path = f"/default-domain/workspaces/{folder_name}"
@@ -195,20 +304,37 @@ def seed_nuxeo_repository(url: str, username: str, password: str) -> bool:
         # Create the folder in the workspaces
         folder = nuxeo.documents.create(folder, parent_path="/default-domain/workspaces")
         logger.info(f"Created folder with ID: {folder.uid}")
+        return folder
     except Exception as e:
         logger.error(f"Failed to create folder: {e}")
-        return False
+        return None
+
+def _create_file_doc(nuxeo: Nuxeo, folder_path: str, pdf_data: bytes) -> Optional[Document]:
+    """
+    Create a file document with a PDF attachment.
     
-    # Create a file document with PDF attachment
+    Args:
+        nuxeo: Connected Nuxeo client
+        folder_path: Path of the folder to create the document in
+        pdf_data: Content of the PDF to attach
+        
+    Returns:
+        The created document, or None if creation failed.
+    """
     file_name = f"Sample File {random.randint(1000, 9999)}"
     logger.info(f"Creating file document: {file_name}")
     
     try:
-        # Create a dummy PDF file
-        pdf_path = create_dummy_pdf()
-        if not pdf_path:
-            logger.error("Failed to create dummy PDF file")
-            return False
+        # Upload the PDF bytes straight from memory, without a temporary file,
+        # so the document can be created with its blob already attached
+        blob = BufferBlob(
+            data=pdf_data,
+            name=f"{file_name}.pdf",
+            mimetype="application/pdf",
+        )
+        uploaded = nuxeo.uploads.batch().upload(
+            blob, chunked=True, chunk_size=UPLOAD_CHUNK_SIZE
+        )
         
         # Create the file document
         file_doc = Document(
@@ -216,38 +342,30 @@ def seed_nuxeo_repository(url: str, username: str, password: str) -> bool:
             type="File",
             properties={
                 "dc:title": file_name,
-                "dc:description": "Sample file for MCP testing"
+                "dc:description": "Sample file for MCP testing",
+                "file:content": blob_reference(uploaded),
             }
         )
         
         # Create the document in the folder
         file_doc = nuxeo.documents.create(file_doc, parent_path=folder_path)
-        logger.info(f"Created file document with ID: {file_doc.uid}")
-        
-        # Attach the PDF file
-        blob = FileBlob(pdf_path)
-        
-
-        # Create and upload a blob
-        uploaded = nuxeo.uploads.batch().upload(blob, chunked=True)
-
-        # Attach it to the file
-        operation = nuxeo.operations.new('Blob.AttachOnDocument')
-        operation.params = {'document': file_doc.uid}
-        operation.input_obj = uploaded
-        operation.execute()
-
-        logger.info(f"Attached PDF to file document")
-        
-        # Clean up the temporary file
-        os.unlink(pdf_path)
+        logger.info(f"Created file document with ID: {file_doc.uid} and attached PDF")
+        return file_doc
     except Exception as e:
         logger.error(f"Failed to create file document: {e}")
-        if pdf_path and os.path.exists(pdf_path):
-            os.unlink(pdf_path)
-        return False
+        return None
+
+def _create_note_doc(nuxeo: Nuxeo, folder_path: str) -> Optional[Document]:
+    """
+    Create a note document with random text.
     
-    # Create a note document with random text
+    Args:
+        nuxeo: Connected Nuxeo client
+        folder_path: Path of the folder to create the document in
+        
+    Returns:
+        The created document, or None if creation failed.
+    """
     note_name = f"Sample Note {random.randint(1000, 9999)}"
     logger.info(f"Creating note document: {note_name}")
     
@@ -267,69 +385,186 @@ def seed_nuxeo_repository(url: str, username: str, password: str) -> bool:
         # Create the note in the folder
         note_doc = nuxeo.documents.create(note_doc, parent_path=folder_path)
         logger.info(f"Created note document with ID: {note_doc.uid}")
+        return note_doc
     except Exception as e:
         logger.error(f"Failed to create note document: {e}")
-        return False
+        return None
+
+def _create_picture_doc(nuxeo: Nuxeo, folder_path: str, image_data: bytes) -> Optional[Document]:
+    """
+    Create a picture document with a PNG image.
     
-    # Create a picture document with a random image
+    Args:
+        nuxeo: Connected Nuxeo client
+        folder_path: Path of the folder to create the document in
+        image_data: Content of the PNG image to attach
+        
+    Returns:
+        The created document, or None if creation failed.
+    """
     picture_name = f"Sample Picture {random.randint(1000, 9999)}"
     logger.info(f"Creating picture document: {picture_name}")
     
     try:
-        # Create a temporary file for the image
-        fd, image_path = tempfile.mkstemp(suffix=".png")
-        try:
-            with os.fdopen(fd, 'wb') as f:
-                f.write(generate_random_image())
-            
-            # Create the picture document
-            picture_doc = Document(
-                name=picture_name,
-                type="Picture",
-                properties={
-                    "dc:title": picture_name,
-                    "dc:description": "Sample picture for MCP testing"
-                }
-            )
-            
-            # Create the document in the folder
-            picture_doc = nuxeo.documents.create(picture_doc, parent_path=folder_path)
-            logger.info(f"Created picture document with ID: {picture_doc.uid}")
-            
-            # Attach the image file
-            blob = FileBlob(image_path)
-            
-            # Create and upload a blob
-            uploaded = nuxeo.uploads.batch().upload(blob, chunked=True)
-            
-            # Attach it to the picture
-            operation = nuxeo.operations.new('Blob.AttachOnDocument')
-            operation.params = {'document': picture_doc.uid}
-            operation.input_obj = uploaded
-            operation.execute()
-            
-            logger.info(f"Attached PNG image to picture document")
-            
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(image_path):
-                os.unlink(image_path)
-                
+        # Upload the image bytes straight from memory
+        blob = BufferBlob(
+            data=image_data,
+            name=f"{picture_name}.png",
+            mimetype="image/png",
+        )
+        uploaded = nuxeo.uploads.batch().upload(
+            blob, chunked=True, chunk_size=UPLOAD_CHUNK_SIZE
+        )
+        
+        # Create the picture document
+        picture_doc = Document(
+            name=picture_name,
+            type="Picture",
+            properties={
+                "dc:title": picture_name,
+                "dc:description": "Sample picture for MCP testing",
+                "file:content": blob_reference(uploaded),
+            }
+        )
+        
+        # Create the document in the folder
+        picture_doc = nuxeo.documents.create(picture_doc, parent_path=folder_path)
+        logger.info(f"Created picture document with ID: {picture_doc.uid} and attached PNG image")
+        return picture_doc
     except Exception as e:
         logger.error(f"Failed to create picture document: {e}")
+        return None
+
+async def _create_folder_children(
+    nuxeo: Nuxeo, folder_path: str, pdf_data: bytes, image_data: bytes
+) -> Tuple[Optional[Document], Optional[Document], Optional[Document]]:
+    """
+    Create the file, note and picture documents concurrently.
+    
+    The documents only share the parent folder, so the blocking client calls
+    run in worker threads and complete in roughly the time of the slowest one.
+    
+    Args:
+        nuxeo: Connected Nuxeo client
+        folder_path: Path of the folder to create the documents in
+        pdf_data: Content of the PDF attached to the file document
+        image_data: Content of the PNG attached to the picture document
+        
+    Returns:
+        The created file, note and picture documents (None for failures).
+    """
+    file_doc, note_doc, picture_doc = await asyncio.gather(
+        asyncio.to_thread(_create_file_doc, nuxeo, folder_path, pdf_data),
+        asyncio.to_thread(_create_note_doc, nuxeo, folder_path),
+        asyncio.to_thread(_create_picture_doc, nuxeo, folder_path, image_data),
+    )
+    return file_doc, note_doc, picture_doc
+
+@lru_cache(maxsize=4)
+def get_nuxeo_client(url: str, username: str, password: str) -> Nuxeo:
+    """
+    Get a Nuxeo client, reused across seedings with the same credentials.
+    
+    Keeping the client keeps its authenticated session and connection pool,
+    so repeated seedings in one process don't reconnect.
+    
+    Args:
+        url: Nuxeo server URL
+        username: Nuxeo username
+        password: Nuxeo password
+        
+    Returns:
+        The configured Nuxeo client
+    """
+    nuxeo = Nuxeo(
+        host=url,
+        auth=(username, password),
+    )
+    configure_connection_pool(nuxeo)
+    return nuxeo
+
+def connect(url: str, username: str, password: str) -> Optional[Nuxeo]:
+    """
+    Connect to the Nuxeo server and check that it is reachable.
+    
+    Args:
+        url: Nuxeo server URL
+        username: Nuxeo username
+        password: Nuxeo password
+        
+    Returns:
+        The connected Nuxeo client, or None if the connection failed.
+    """
+    logger.info(f"Connecting to Nuxeo server at {url}")
+    nuxeo = get_nuxeo_client(url, username, password)
+    
+    # Check if connection is successful
+    try:
+        server_info = nuxeo.client.server_info()
+        logger.info(f"Connected to Nuxeo server version: {server_info['productVersion']}")
+    except Exception as e:
+        logger.error(f"Failed to connect to Nuxeo server: {e}")
+        return None
+    return nuxeo
+
+def seed(nuxeo: Nuxeo) -> bool:
+    """
+    Seed the repository with sample documents using a connected client.
+    
+    Callers seeding several times can reuse the client returned by connect().
+    
+    Args:
+        nuxeo: Connected Nuxeo client
+        
+    Returns:
+        True if seeding was successful, False otherwise.
+    """
+    # Generate the PDF and PNG content in worker threads while the folder
+    # is being created; PNG encoding releases the GIL inside zlib
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pdf_future = executor.submit(create_dummy_pdf_bytes)
+        image_future = executor.submit(generate_random_image)
+
+        folder = _create_folder(nuxeo)
+        if folder is None:
+            return False
+        
+        pdf_data, image_data = pdf_future.result(), image_future.result()
+    
+    file_doc, note_doc, picture_doc = asyncio.run(
+        _create_folder_children(nuxeo, folder.path, pdf_data, image_data)
+    )
+    if file_doc is None or note_doc is None or picture_doc is None:
         return False
     
     logger.info("Successfully seeded Nuxeo repository with sample documents")
     
     # Print summary
     print("\nSummary of created documents:")
-    print(f"Folder: {folder_path} (ID: {folder.uid})")
-    print(f"File: {folder_path}/{file_name} (ID: {file_doc.uid})")
-    print(f"Note: {folder_path}/{note_name} (ID: {note_doc.uid})")
-    print(f"Picture: {folder_path}/{picture_name} (ID: {picture_doc.uid})")
+    print(f"Folder: {folder.path} (ID: {folder.uid})")
+    print(f"File: {file_doc.path} (ID: {file_doc.uid})")
+    print(f"Note: {note_doc.path} (ID: {note_doc.uid})")
+    print(f"Picture: {picture_doc.path} (ID: {picture_doc.uid})")
     
     return True
 
+def seed_nuxeo_repository(url: str, username: str, password: str) -> bool:
+    """
+    Seed the Nuxeo repository with sample documents.
+    
+    Args:
+        url: Nuxeo server URL
+        username: Nuxeo username
+        password: Nuxeo password
+        
+    Returns:
+        True if seeding was successful, False otherwise.
+    """
+    nuxeo = connect(url, username, password)
+    if nuxeo is None:
+        return False
+    return seed(nuxeo)
+
 def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Seed Nuxeo repository with sample documents")
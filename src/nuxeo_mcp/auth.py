@@ -7,18 +7,18 @@ including browser-based authentication and token management.
 
 import base64
 import hashlib
+import html
+import itertools
 import logging
 import secrets
 import socket
 import threading
 import time
-import webbrowser
-from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from dataclasses import dataclass, field
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Optional, Tuple, Dict, Any
 from urllib.parse import parse_qs, urlparse
 
-import aiohttp
 from nuxeo.auth import OAuth2
 from nuxeo.client import Nuxeo
 
@@ -27,14 +27,194 @@ from .token_store import TokenManager
 
 logger = logging.getLogger(__name__)
 
+# Loopback address the OAuth2 callback server listens on
+CALLBACK_HOST = "127.0.0.1"
+
+# Page shown in the browser once the authorization code has been received,
+# encoded once at import time
+SUCCESS_HTML_BYTES = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Authentication Successful</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .container {
+            background: white;
+            padding: 40px;
+            border-radius: 10px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 400px;
+        }
+        .success-icon {
+            font-size: 48px;
+            color: #10b981;
+            margin-bottom: 20px;
+        }
+        h1 {
+            color: #1f2937;
+            margin-bottom: 10px;
+        }
+        p {
+            color: #6b7280;
+            margin-bottom: 20px;
+        }
+        .close-hint {
+            font-size: 14px;
+            color: #9ca3af;
+        }
+    </style>
+    <script>
+        setTimeout(function() {
+            window.close();
+        }, 3000);
+    </script>
+</head>
+<body>
+    <div class="container">
+        <div class="success-icon">✓</div>
+        <h1>Authentication Successful!</h1>
+        <p>You have been successfully authenticated with Nuxeo.</p>
+        <p class="close-hint">This window will close automatically...</p>
+    </div>
+</body>
+</html>
+""".encode("utf-8")
+
+# Page shown when the authorization server returns an error; the marker is
+# replaced with the escaped error description
+_ERROR_DESCRIPTION_MARKER = b"%ERROR_DESCRIPTION%"
+ERROR_HTML_TEMPLATE_BYTES = """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Authentication Failed</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #f87171 0%, #ef4444 100%);
+        }
+        .container {
+            background: white;
+            padding: 40px;
+            border-radius: 10px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 400px;
+        }
+        .error-icon {
+            font-size: 48px;
+            color: #ef4444;
+            margin-bottom: 20px;
+        }
+        h1 {
+            color: #1f2937;
+            margin-bottom: 10px;
+        }
+        p {
+            color: #6b7280;
+            margin-bottom: 20px;
+        }
+        .error-details {
+            background: #fef2f2;
+            padding: 10px;
+            border-radius: 5px;
+            color: #991b1b;
+            font-size: 14px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="error-icon">✗</div>
+        <h1>Authentication Failed</h1>
+        <p>There was an error during authentication.</p>
+        <div class="error-details">%ERROR_DESCRIPTION%</div>
+    </div>
+</body>
+</html>
+""".encode("utf-8")
+
+
+def generate_s256_pkce() -> Tuple[str, str]:
+    """
+    Generate a PKCE code verifier and its S256 code challenge.
+    
+    Returns:
+        Tuple of (code_verifier, code_challenge)
+    """
+    # 32 random bytes give a 43-character unpadded base64url verifier
+    code_verifier = secrets.token_urlsafe(32)
+    
+    # Code challenge is the unpadded base64url SHA256 of the verifier
+    digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
+    code_challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+    
+    return code_verifier, code_challenge
+
+
+@dataclass
+class _Flow:
+    """A pending authorization code flow, keyed by its state."""
+    code_verifier: str
+    redirect_uri: str
+    oauth2_auth: Any
+    event: threading.Event = field(default_factory=threading.Event)
+    auth_code: Optional[str] = None
+    auth_error: Optional[str] = None
+
 
 class OAuth2CallbackHandler(BaseHTTPRequestHandler):
     """HTTP request handler for OAuth2 callback."""
     
+    # Bodies are delimited by Content-Length rather than by closing the socket
+    protocol_version = "HTTP/1.1"
+    
     def log_message(self, format, *args):
         """Override to suppress default HTTP server logs."""
         pass
     
+    def _send_html(self, status: int, body: bytes) -> None:
+        """
+        Send a complete HTML response and close the connection.
+        
+        The explicit Content-Length lets the browser render the page as soon as
+        it arrives, and closing right after the flush frees the handler thread
+        before the callback server is shut down.
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+    
+    def _signal_done(
+        self,
+        state: Optional[str],
+        auth_code: Optional[str] = None,
+        auth_error: Optional[str] = None,
+    ) -> None:
+        """Hand the callback result to its flow, waking up the waiting thread."""
+        auth_handler = getattr(self.server, "auth_handler", None)
+        if auth_handler is not None:
+            auth_handler._complete_flow(state, auth_code=auth_code, auth_error=auth_error)
+    
     def do_GET(self):
         """Handle GET request for OAuth2 callback."""
         query_components = parse_qs(urlparse(self.path).query)
@@ -44,136 +224,22 @@ class OAuth2CallbackHandler(BaseHTTPRequestHandler):
             self.server.state = query_components.get("state", [None])[0]
             
             # Send success response
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            success_html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Authentication Successful</title>
-                <style>
-                    body {
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    }
-                    .container {
-                        background: white;
-                        padding: 40px;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }
-                    .success-icon {
-                        font-size: 48px;
-                        color: #10b981;
-                        margin-bottom: 20px;
-                    }
-                    h1 {
-                        color: #1f2937;
-                        margin-bottom: 10px;
-                    }
-                    p {
-                        color: #6b7280;
-                        margin-bottom: 20px;
-                    }
-                    .close-hint {
-                        font-size: 14px;
-                        color: #9ca3af;
-                    }
-                </style>
-                <script>
-                    setTimeout(function() {
-                        window.close();
-                    }, 3000);
-                </script>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="success-icon">✓</div>
-                    <h1>Authentication Successful!</h1>
-                    <p>You have been successfully authenticated with Nuxeo.</p>
-                    <p class="close-hint">This window will close automatically...</p>
-                </div>
-            </body>
-            </html>
-            """
-            self.wfile.write(success_html.encode())
+            self._send_html(200, SUCCESS_HTML_BYTES)
+            self._signal_done(self.server.state, auth_code=self.server.auth_code)
             
         elif "error" in query_components:
             self.server.auth_error = query_components["error"][0]
             error_description = query_components.get("error_description", ["Unknown error"])[0]
             
             # Send error response
-            self.send_response(400)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            error_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Authentication Failed</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        height: 100vh;
-                        margin: 0;
-                        background: linear-gradient(135deg, #f87171 0%, #ef4444 100%);
-                    }}
-                    .container {{
-                        background: white;
-                        padding: 40px;
-                        border-radius: 10px;
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                        text-align: center;
-                        max-width: 400px;
-                    }}
-                    .error-icon {{
-                        font-size: 48px;
-                        color: #ef4444;
-                        margin-bottom: 20px;
-                    }}
-                    h1 {{
-                        color: #1f2937;
-                        margin-bottom: 10px;
-                    }}
-                    p {{
-                        color: #6b7280;
-                        margin-bottom: 20px;
-                    }}
-                    .error-details {{
-                        background: #fef2f2;
-                        padding: 10px;
-                        border-radius: 5px;
-                        color: #991b1b;
-                        font-size: 14px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="error-icon">✗</div>
-                    <h1>Authentication Failed</h1>
-                    <p>There was an error during authentication.</p>
-                    <div class="error-details">{error_description}</div>
-                </div>
-            </body>
-            </html>
-            """
-            self.wfile.write(error_html.encode())
+            escaped = html.escape(error_description).encode("utf-8")
+            self._send_html(400, ERROR_HTML_TEMPLATE_BYTES.replace(_ERROR_DESCRIPTION_MARKER, escaped))
+            self._signal_done(
+                query_components.get("state", [None])[0], auth_error=self.server.auth_error
+            )
         else:
             self.send_response(404)
+            self.send_header("Content-Length", "0")
             self.end_headers()
 
 
@@ -192,38 +258,47 @@ class OAuth2AuthHandler:
         self.token_manager = token_manager or TokenManager()
         self.oauth2_config = server_config.oauth2_config
         self.nuxeo_client: Optional[Nuxeo] = None
+        # Pending authorization flows by state, all served by one callback
+        # server; the lock also guards creation of nuxeo_client
+        self._flows: Dict[str, _Flow] = {}
+        self._flows_lock = threading.Lock()
+        self._flow_counter = itertools.count()
+        self._callback_server: Optional[HTTPServer] = None
+        self._callback_port: Optional[int] = None
         
         if not self.oauth2_config:
             raise ValueError("OAuth2 configuration required")
     
-    def _find_available_port(self, start_port: int = 8080, max_attempts: int = 100) -> int:
+    def _find_available_port(self) -> int:
         """Find an available port for the callback server."""
-        for port in range(start_port, start_port + max_attempts):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(("localhost", port))
-                    return port
-            except OSError:
-                continue
-        raise RuntimeError(f"Could not find available port in range {start_port}-{start_port + max_attempts}")
+        # Let the kernel pick a free ephemeral port in a single bind
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind((CALLBACK_HOST, 0))
+            return s.getsockname()[1]
     
     def _generate_pkce_challenge(self) -> Tuple[str, str]:
         """Generate PKCE code verifier and challenge."""
-        # Generate code verifier (43-128 characters)
-        code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode("utf-8").rstrip("=")
-        
-        # Generate code challenge (SHA256 of verifier)
-        challenge = hashlib.sha256(code_verifier.encode()).digest()
-        code_challenge = base64.urlsafe_b64encode(challenge).decode("utf-8").rstrip("=")
-        
-        return code_verifier, code_challenge
+        return generate_s256_pkce()
     
     def _start_callback_server(self, port: int) -> HTTPServer:
         """Start the OAuth2 callback server."""
-        server = HTTPServer(("localhost", port), OAuth2CallbackHandler)
+        # Threading server so stray requests (e.g. favicon) don't block the callback
+        server = ThreadingHTTPServer(
+            (CALLBACK_HOST, port), OAuth2CallbackHandler, bind_and_activate=False
+        )
+        # Take over the port just released by _find_available_port
+        server.allow_reuse_address = True
+        try:
+            server.server_bind()
+            server.server_activate()
+        except OSError:
+            server.server_close()
+            raise
         server.auth_code = None
         server.auth_error = None
         server.state = None
+        # Callbacks are dispatched to the matching flow by their state
+        server.auth_handler = self
         
         # Start server in a separate thread
         server_thread = threading.Thread(target=server.serve_forever, daemon=True)
@@ -249,103 +324,163 @@ class OAuth2AuthHandler:
                 self._setup_nuxeo_client(existing_token)
                 return True
             
-            # Find available port for callback
-            redirect_port = self.oauth2_config.redirect_port or self._find_available_port()
-            redirect_uri = f"http://localhost:{redirect_port}/callback"
-            
-            # Start callback server
-            callback_server = self._start_callback_server(redirect_port)
-            
             # Generate PKCE parameters
             code_verifier, code_challenge = self._generate_pkce_challenge()
             
-            # Generate state for CSRF protection
-            state = secrets.token_urlsafe(32)
-            
-            # Create Nuxeo client with OAuth2
-            self.nuxeo_client = Nuxeo(host=self.server_config.url)
-            oauth2_auth = OAuth2(
-                self.server_config.url,
-                client_id=self.oauth2_config.client_id,
-                client_secret=self.oauth2_config.client_secret,
-                redirect_uri=redirect_uri,
-                authorization_endpoint=self.oauth2_config.authorization_endpoint,
-                token_endpoint=self.oauth2_config.token_endpoint,
-                openid_configuration_url=self.oauth2_config.openid_configuration_url,
-            )
-            self.nuxeo_client.client.auth = oauth2_auth
-            
-            # Generate authorization URL with PKCE
-            auth_url, returned_state, _ = oauth2_auth.create_authorization_url(
-                code_challenge=code_challenge,
-                code_challenge_method="S256",
-                state=state,
-            )
-            
-            logger.info(f"Authorization URL: {auth_url}")
+            # Generate state for CSRF protection; the counter keeps it unique
+            # among the flows sharing the callback server
+            state = f"{secrets.token_urlsafe(24)}-{next(self._flow_counter)}"
             
-            if open_browser:
-                # Open browser for authentication
-                webbrowser.open(auth_url)
-                print("\n🔐 Opening browser for authentication...")
-                print(f"If the browser doesn't open, please visit:\n{auth_url}\n")
-            else:
-                print(f"\n🔐 Please visit the following URL to authenticate:\n{auth_url}\n")
+            with self._flows_lock:
+                # Start the callback server, or share the one already running
+                if self._callback_server is None:
+                    redirect_port = self.oauth2_config.redirect_port or self._find_available_port()
+                    self._callback_server = self._start_callback_server(redirect_port)
+                    self._callback_port = redirect_port
+                redirect_uri = f"http://localhost:{self._callback_port}/callback"
+                
+                # Create Nuxeo client, reusing the existing one and its pooled
+                # connections if there is one
+                if self.nuxeo_client is None:
+                    self.nuxeo_client = Nuxeo(host=self.server_config.url)
+                
+                oauth2_auth = OAuth2(
+                    self.server_config.url,
+                    client_id=self.oauth2_config.client_id,
+                    client_secret=self.oauth2_config.client_secret,
+                    redirect_uri=redirect_uri,
+                    authorization_endpoint=self.oauth2_config.authorization_endpoint,
+                    token_endpoint=self.oauth2_config.token_endpoint,
+                    openid_configuration_url=self.oauth2_config.openid_configuration_url,
+                )
+                
+                # Register the flow before the browser can call back
+                flow = _Flow(code_verifier, redirect_uri, oauth2_auth)
+                self._flows[state] = flow
             
-            # Wait for callback (timeout after 5 minutes)
-            timeout = 300  # 5 minutes
-            start_time = time.time()
+            try:
+                return self._run_flow(state, flow, code_challenge, open_browser)
+            finally:
+                self._release_flow(state)
             
-            while time.time() - start_time < timeout:
-                if callback_server.auth_code:
-                    # Validate state
-                    if callback_server.state != state:
-                        logger.error("State mismatch - possible CSRF attack")
-                        return False
-                    
-                    # Exchange code for token
-                    token = oauth2_auth.request_token(
-                        authorization_response=f"{redirect_uri}?code={callback_server.auth_code}&state={state}",
-                        code_verifier=code_verifier,
-                    )
-                    
-                    # Store token
-                    self.token_manager.store_token(self.server_config.url, token)
-                    
-                    # Validate token by making a test request
-                    if self._validate_token(token):
-                        logger.info("Authentication successful")
-                        print("✅ Authentication successful!")
-                        callback_server.shutdown()
-                        return True
-                    else:
-                        logger.error("Token validation failed")
-                        print("❌ Token validation failed")
-                        callback_server.shutdown()
-                        return False
-                    
-                elif callback_server.auth_error:
-                    logger.error(f"Authentication error: {callback_server.auth_error}")
-                    print(f"❌ Authentication failed: {callback_server.auth_error}")
-                    callback_server.shutdown()
-                    return False
-                
-                time.sleep(0.5)
+        except Exception as e:
+            logger.error(f"Authentication failed: {e}")
+            print(f"❌ Authentication failed: {e}")
+            return False
+    
+    def _run_flow(self, state: str, flow: _Flow, code_challenge: str, open_browser: bool) -> bool:
+        """
+        Send the user to the authorization page and complete a registered flow.
+        
+        Args:
+            state: State identifying the flow
+            flow: The registered flow
+            code_challenge: PKCE code challenge matching the flow's verifier
+            open_browser: Whether to automatically open the browser
             
+        Returns:
+            True if authentication successful, False otherwise
+        """
+        # Generate authorization URL with PKCE
+        auth_url, _, _ = flow.oauth2_auth.create_authorization_url(
+            code_challenge=code_challenge,
+            code_challenge_method="S256",
+            state=state,
+        )
+        
+        logger.info(f"Authorization URL: {auth_url}")
+        
+        if open_browser:
+            # Open browser for authentication; webbrowser is only needed here
+            import webbrowser
+            webbrowser.open(auth_url)
+            print("\n🔐 Opening browser for authentication...")
+            print(f"If the browser doesn't open, please visit:\n{auth_url}\n")
+        else:
+            print(f"\n🔐 Please visit the following URL to authenticate:\n{auth_url}\n")
+        
+        # Wait for callback (timeout after 5 minutes)
+        timeout = 300  # 5 minutes
+        if not flow.event.wait(timeout=timeout):
             # Timeout
             logger.error("Authentication timeout")
             print("❌ Authentication timeout - no response received")
-            callback_server.shutdown()
             return False
+        
+        if flow.auth_code:
+            # The callback was dispatched by state, so it matches this flow;
+            # exchange code for token
+            token = flow.oauth2_auth.request_token(
+                authorization_response=f"{flow.redirect_uri}?code={flow.auth_code}&state={state}",
+                code_verifier=flow.code_verifier,
+            )
             
-        except Exception as e:
-            logger.error(f"Authentication failed: {e}")
-            print(f"❌ Authentication failed: {e}")
-            return False
+            # Store token
+            self.token_manager.store_token(self.server_config.url, token)
+            with self._flows_lock:
+                self.nuxeo_client.client.auth = flow.oauth2_auth
+            
+            # Validate token by making a test request
+            if self._validate_token(token):
+                logger.info("Authentication successful")
+                print("✅ Authentication successful!")
+                return True
+            else:
+                logger.error("Token validation failed")
+                print("❌ Token validation failed")
+                return False
+        
+        logger.error(f"Authentication error: {flow.auth_error}")
+        print(f"❌ Authentication failed: {flow.auth_error}")
+        return False
+    
+    def _complete_flow(
+        self,
+        state: Optional[str],
+        auth_code: Optional[str] = None,
+        auth_error: Optional[str] = None,
+    ) -> None:
+        """
+        Record a callback result on the flow it belongs to.
+        
+        Codes for an unknown state are ignored. An error without a state
+        cannot be matched to a flow, so it fails every pending flow.
+        """
+        with self._flows_lock:
+            if state in self._flows:
+                flows = [self._flows[state]]
+            elif auth_error is not None and state is None:
+                flows = list(self._flows.values())
+            else:
+                logger.error("Callback state does not match any pending flow - possible CSRF attack")
+                return
+            for flow in flows:
+                flow.auth_code = auth_code
+                flow.auth_error = auth_error
+                flow.event.set()
+    
+    def _release_flow(self, state: str) -> None:
+        """Forget a finished flow and stop the callback server once none remain."""
+        with self._flows_lock:
+            self._flows.pop(state, None)
+            if self._flows or self._callback_server is None:
+                return
+            callback_server = self._callback_server
+            self._callback_server = None
+            self._callback_port = None
+        callback_server.shutdown()
+        # Release the listening socket as well
+        callback_server.server_close()
     
     def _setup_nuxeo_client(self, token: Dict[str, Any]) -> None:
-        """Setup Nuxeo client with OAuth2 token."""
-        self.nuxeo_client = Nuxeo(host=self.server_config.url)
+        """
+        Setup Nuxeo client with OAuth2 token.
+        
+        An existing client is kept and only its auth is replaced, so its HTTP
+        session and keep-alive connections survive token refreshes.
+        """
+        if self.nuxeo_client is None:
+            self.nuxeo_client = Nuxeo(host=self.server_config.url)
         oauth2_auth = OAuth2(
             self.server_config.url,
             client_id=self.oauth2_config.client_id,
@@ -359,7 +494,7 @@ class OAuth2AuthHandler:
         expires_at = token.get("expires_at")
         if not expires_at:
             return False
-        return datetime.now().timestamp() >= expires_at - 60  # 60 second buffer
+        return time.time() >= expires_at - 60  # 60 second buffer
     
     def _validate_token(self, token: Dict[str, Any]) -> bool:
         """Validate token by making a test API request."""
@@ -410,14 +545,27 @@ class OAuth2AuthHandler:
             return False
     
     def get_nuxeo_client(self) -> Optional[Nuxeo]:
-        """Get authenticated Nuxeo client."""
+        """
+        Get authenticated Nuxeo client.
+        
+        A stored token is reused, or refreshed when expired, before falling back
+        to the full browser flow, so a fresh process with a cached token does
+        not prompt the user again.
+        """
+        token = self.token_manager.get_token(self.server_config.url)
+        
         if not self.nuxeo_client:
-            # Try to authenticate
-            if not self.authenticate():
+            if token and not self._is_token_expired(token):
+                self._setup_nuxeo_client(token)
+            elif token and token.get("refresh_token"):
+                # refresh_token() sets the client up with the stored token first
+                if not self.refresh_token() and not self.authenticate():
+                    return None
+            elif not self.authenticate():
                 return None
+            return self.nuxeo_client
         
         # Check if token needs refresh
-        token = self.token_manager.get_token(self.server_config.url)
         if token and self._is_token_expired(token):
             if not self.refresh_token():
                 # Refresh failed, try full authentication
@@ -444,10 +592,12 @@ class BasicAuthHandler:
     def authenticate(self) -> bool:
         """Authenticate using basic auth."""
         try:
-            self.nuxeo_client = Nuxeo(
-                host=self.server_config.url,
-                auth=(self.server_config.username, self.server_config.password),
-            )
+            # Reuse the client, and its pooled connections, on re-authentication
+            if self.nuxeo_client is None:
+                self.nuxeo_client = Nuxeo(
+                    host=self.server_config.url,
+                    auth=(self.server_config.username, self.server_config.password),
+                )
             
             # Validate credentials - use /api/v1/me endpoint which works on this server
             response = self.nuxeo_client.client.request("GET", "/api/v1/me")
@@ -6,8 +6,10 @@ credential management, and multiple Nuxeo instance support.
 """
 
 import os
+import copy
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Any, Literal
 from dataclasses import dataclass, asdict, field
@@ -16,6 +18,34 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+ENV_PREFIX = "NUXEO_"
+
+
+def _nuxeo_env() -> Dict[str, str]:
+    """Snapshot the NUXEO_* environment variables into a plain dict."""
+    return {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+
+
+@lru_cache(maxsize=8)
+def _load_raw(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file, memoized on its stat signature.
+
+    The modification time and size are part of the cache key so that a file
+    rewritten on disk is parsed again on the next call.
+
+    Args:
+        path_str: Path of the configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        The parsed JSON document (shared; callers must not mutate it)
+    """
+    with open(path_str, "r") as f:
+        return json.load(f)
+
+
 class AuthMethod(Enum):
     """Supported authentication methods."""
     OAUTH2 = "oauth2"
@@ -35,10 +65,12 @@ class OAuth2Config:
     scope: str = "openid profile email"
     
     @classmethod
-    def from_env(cls) -> Optional["OAuth2Config"]:
+    def from_env(cls, env: Optional[Dict[str, str]] = None) -> Optional["OAuth2Config"]:
         """Create OAuth2Config from environment variables."""
-        client_id = os.environ.get("NUXEO_OAUTH_CLIENT_ID")
-        client_secret = os.environ.get("NUXEO_OAUTH_CLIENT_SECRET")
+        if env is None:
+            env = _nuxeo_env()
+        client_id = env.get("NUXEO_OAUTH_CLIENT_ID")
+        client_secret = env.get("NUXEO_OAUTH_CLIENT_SECRET")
         
         if not client_id or not client_secret:
             return None
@@ -46,11 +78,11 @@ class OAuth2Config:
         return cls(
             client_id=client_id,
             client_secret=client_secret,
-            redirect_port=int(os.environ.get("NUXEO_OAUTH_REDIRECT_PORT", "0")),
-            authorization_endpoint=os.environ.get("NUXEO_OAUTH_AUTH_ENDPOINT"),
-            token_endpoint=os.environ.get("NUXEO_OAUTH_TOKEN_ENDPOINT"),
-            openid_configuration_url=os.environ.get("NUXEO_OAUTH_OPENID_URL"),
-            scope=os.environ.get("NUXEO_OAUTH_SCOPE", "openid profile email"),
+            redirect_port=int(env.get("NUXEO_OAUTH_REDIRECT_PORT", "0")),
+            authorization_endpoint=env.get("NUXEO_OAUTH_AUTH_ENDPOINT"),
+            token_endpoint=env.get("NUXEO_OAUTH_TOKEN_ENDPOINT"),
+            openid_configuration_url=env.get("NUXEO_OAUTH_OPENID_URL"),
+            scope=env.get("NUXEO_OAUTH_SCOPE", "openid profile email"),
         )
 
 
@@ -90,7 +122,7 @@ class MCPAuthConfig:
     
     @staticmethod
     def _get_default_config_path() -> Path:
-        """Get the default configuration file path based on the OS."""
+        """Get the default configuration file path for the OS, without touching the disk."""
         if os.name == "nt":  # Windows
             base_path = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
         elif os.name == "posix":
@@ -101,9 +133,12 @@ class MCPAuthConfig:
         else:
             base_path = Path.home() / ".config"
         
-        config_dir = base_path / "nuxeo-mcp"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "auth_config.json"
+        return base_path / "nuxeo-mcp" / "auth_config.json"
+    
+    @staticmethod
+    def _ensure_config_dir(path: Path) -> None:
+        """Create the directory holding the configuration file if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
     
     def save(self) -> None:
         """Save configuration to file."""
@@ -132,7 +167,7 @@ class MCPAuthConfig:
             if server_data.get("oauth2_config", {}).get("client_secret"):
                 server_data["oauth2_config"]["client_secret"] = "***"
         
-        self.config_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_config_dir(self.config_file_path)
         with open(self.config_file_path, "w") as f:
             json.dump(config_data, f, indent=2)
         
@@ -145,10 +180,15 @@ class MCPAuthConfig:
         
         # Load from file if it exists
         file_path = config_path or config._get_default_config_path()
-        if file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = copy.deepcopy(
+                    _load_raw(str(file_path), stat.st_mtime_ns, stat.st_size)
+                )
                     
                 config.default_server = data.get("default_server")
                 config.enable_browser_auth = data.get("enable_browser_auth", True)
@@ -186,27 +226,28 @@ class MCPAuthConfig:
     
     def _load_env_config(self) -> None:
         """Load configuration from environment variables."""
-        nuxeo_url = os.environ.get("NUXEO_URL")
+        env = _nuxeo_env()
+        nuxeo_url = env.get("NUXEO_URL")
         if not nuxeo_url:
             return
             
-        auth_method_str = os.environ.get("NUXEO_AUTH_METHOD", "basic").lower()
+        auth_method_str = env.get("NUXEO_AUTH_METHOD", "basic").lower()
         try:
             auth_method = AuthMethod(auth_method_str)
         except ValueError:
             logger.warning(f"Invalid auth method: {auth_method_str}, falling back to basic")
             auth_method = AuthMethod.BASIC
         
-        oauth2_config = OAuth2Config.from_env() if auth_method == AuthMethod.OAUTH2 else None
+        oauth2_config = OAuth2Config.from_env(env) if auth_method == AuthMethod.OAUTH2 else None
         
         # Create or update the "default" server configuration
         self.servers["default"] = NuxeoServerConfig(
             url=nuxeo_url,
             auth_method=auth_method,
-            username=os.environ.get("NUXEO_USERNAME"),
-            password=os.environ.get("NUXEO_PASSWORD"),
+            username=env.get("NUXEO_USERNAME"),
+            password=env.get("NUXEO_PASSWORD"),
             oauth2_config=oauth2_config,
-            jwt_secret=os.environ.get("NUXEO_JWT_SECRET"),
+            jwt_secret=env.get("NUXEO_JWT_SECRET"),
         )
         
         if not self.default_server:
@@ -1,10 +1,21 @@
 """Elasticsearch Passthrough Handler for Nuxeo MCP."""
 
 import os
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .nl_parser import NaturalLanguageParser
 from .es_query_builder import ElasticsearchQueryBuilder
@@ -17,10 +28,116 @@ from .search_filters import (
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the Elasticsearch session
+ES_POOL_CONNECTIONS = 8
+ES_POOL_MAXSIZE = 32
+
+# Retries for transient Elasticsearch failures, below the Python call stack
+ES_RETRY_TOTAL = 3
+ES_RETRY_STATUSES = (429, 502, 503, 504)
+
+# Seconds to wait for the availability probe of an index
+ES_PROBE_TIMEOUT = 2
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Body of the availability probe: no hits, only whether the search succeeds
+_PROBE_BODY = _dumps({"query": {"match_all": {}}, "size": 0})
+
+# (result key, _source field) pairs copied into formatted hits
+_REPOSITORY_HIT_FIELDS = (
+    ("title", "dc:title"),
+    ("path", "ecm:path"),
+    ("type", "ecm:primaryType"),
+    ("modified", "dc:modified"),
+    ("creator", "dc:creator"),
+)
+_AUDIT_HIT_FIELDS = (
+    ("id", "id"),
+    ("eventId", "eventId"),
+    ("eventDate", "eventDate"),
+    ("docUUID", "docUUID"),
+    ("docPath", "docPath"),
+    ("principalName", "principalName"),
+    ("category", "category"),
+    ("comment", "comment"),
+)
+
+# _source fields fetched by default, i.e. only what the formatters read
+_REPOSITORY_SOURCE_FIELDS = ("uid", "ecm:uuid") + tuple(
+    field for _, field in _REPOSITORY_HIT_FIELDS
+)
+_AUDIT_SOURCE_FIELDS = tuple(field for _, field in _AUDIT_HIT_FIELDS)
+
+# Parse flags for _parse_cached
+_SORT = 1
+_PAGINATION = 2
+_HIGHLIGHT = 4
+_ACL = 8
+
+# Fixed parse options for each kind of search
+_REPOSITORY_PARSE_FLAGS = _SORT | _PAGINATION | _HIGHLIGHT | _ACL
+_AUDIT_PARSE_FLAGS = _SORT | _PAGINATION
+
+# The parser is stateless, so one instance serves every passthrough
+_PARSER = NaturalLanguageParser()
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(
+    query: str,
+    index: str,
+    flags: int,
+    principals: Tuple[str, ...],
+    source: Optional[Tuple[str, ...]],
+) -> Dict[str, Any]:
+    """Translate a natural language query to Elasticsearch DSL, memoized.
+
+    The returned dict is shared between callers. Nothing downstream modifies
+    its nested values, so a shallow copy is enough before setting top-level
+    keys such as ``size`` or ``from``.
+    """
+    return _PARSER.parse_to_elasticsearch(
+        query,
+        index=index,
+        include_sort=bool(flags & _SORT),
+        include_pagination=bool(flags & _PAGINATION),
+        include_highlight=bool(flags & _HIGHLIGHT),
+        apply_acl=bool(flags & _ACL),
+        user_principals=list(principals) or None,
+        source_includes=list(source) if source else None,
+    )
+
 
 class ElasticsearchPassthrough:
     """Handle Elasticsearch passthrough requests with security filtering."""
 
+    # Filter class for each index; unknown indexes use the "nuxeo" filter
+    _FILTER_FACTORIES = {
+        "nuxeo": DefaultSearchRequestFilter,
+        "repository": DefaultSearchRequestFilter,
+        "audit": AuditRequestFilter,
+        "audit_wf": WorkflowAuditRequestFilter,
+    }
+
+    # Pre-encoded _msearch header lines, one per known index
+    _MSEARCH_HEADERS = {
+        index: _dumps({"index": index}) + b"\n" for index in _FILTER_FACTORIES
+    }
+
     def __init__(self, nuxeo_url: Optional[str] = None, auth: Optional[tuple] = None):
         """Initialize Elasticsearch passthrough.
 
@@ -28,6 +145,7 @@ class ElasticsearchPassthrough:
             nuxeo_url: Base URL for Nuxeo server
             auth: Authentication tuple (username, password)
         """
+        self.nuxeo_url = nuxeo_url
         # Use Nuxeo's ES passthrough endpoint
         if nuxeo_url:
             # Remove trailing slash if present
@@ -40,16 +158,47 @@ class ElasticsearchPassthrough:
             )
         
         self.auth = auth
-        self.nl_parser = NaturalLanguageParser()
+        self._session = self._create_session(auth)
+        self.nl_parser = _PARSER
         self.es_builder = ElasticsearchQueryBuilder()
 
-        # Initialize filters
-        self.filters = {
-            "nuxeo": DefaultSearchRequestFilter(),
-            "repository": DefaultSearchRequestFilter(),
-            "audit": AuditRequestFilter(),
-            "audit_wf": WorkflowAuditRequestFilter(),
-        }
+        # Filters by index, created on first use
+        self.filters: Dict[str, SearchRequestFilter] = {}
+
+    @staticmethod
+    def _create_session(auth: Optional[tuple]) -> requests.Session:
+        """Create a pooled, keep-alive HTTP session for Elasticsearch requests.
+
+        Args:
+            auth: Authentication tuple (username, password)
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        # _search is read-only, so POSTs are safe to retry on rate limiting and
+        # transient errors such as shard relocation; the last response is
+        # returned rather than raised so execute_query reports its status
+        retries = Retry(
+            total=ES_RETRY_TOTAL,
+            backoff_factor=0.2,
+            status_forcelist=ES_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=ES_POOL_CONNECTIONS,
+            pool_maxsize=ES_POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"Content-Type": "application/json", "Connection": "keep-alive"}
+        )
+        session.auth = auth
+        return session
 
     def search_repository(
         self,
@@ -68,7 +217,8 @@ class ElasticsearchPassthrough:
             groups: Groups the user belongs to
             limit: Maximum number of results
             offset: Pagination offset
-            source_fields: Fields to include in response
+            source_fields: Fields to include in response; defaults to the
+                fields used in the formatted results
 
         Returns:
             Formatted search results
@@ -77,31 +227,17 @@ class ElasticsearchPassthrough:
             PermissionError: If user lacks permission
             Exception: For Elasticsearch errors
         """
-        # Parse natural language to Elasticsearch DSL
-        es_request = self.nl_parser.parse_to_elasticsearch(
-            query,
-            index="repository",
-            include_sort=True,
-            include_pagination=True,
-            include_highlight=True,
-            apply_acl=True,
-            user_principals=[principal] + groups,
-            source_includes=source_fields,
+        es_request = self._build_repository_request(
+            query, principal, groups, limit, offset, source_fields
         )
 
-        # Override pagination if provided
-        if limit:
-            es_request["size"] = limit
-        if offset:
-            es_request["from"] = offset
-
         # Execute query
-        response = self.execute_query(
+        response, body = self._execute_query(
             index="nuxeo", query=es_request, principal=principal, groups=groups
         )
 
-        # Format results
-        return self._format_repository_results(response, json.dumps(es_request))
+        # Format results, reporting the body that was actually sent
+        return self._format_repository_results(response, body.decode("utf-8"))
 
     def search_audit(
         self,
@@ -127,16 +263,183 @@ class ElasticsearchPassthrough:
             PermissionError: If user is not administrator
             Exception: For Elasticsearch errors
         """
+        es_request = self._build_audit_request(query, principal, groups, limit, offset)
+
+        # Execute query (no ACL filter for audit)
+        response, body = self._execute_query(
+            index="audit", query=es_request, principal=principal, groups=groups
+        )
+
+        # Format results, reporting the body that was actually sent
+        return self._format_audit_results(response, body.decode("utf-8"))
+
+    def search_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        principal: str,
+        groups: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Run several natural language searches in a single _msearch request.
+
+        Args:
+            queries: Searches to run, each a dict with a "query" string and
+                optional "index" ("repository" or "audit", default
+                "repository"), "limit", "offset" and "source_fields" keys
+            principal: User principal making the request
+            groups: Groups the user belongs to
+
+        Returns:
+            Formatted results for each search, in order; a search that failed
+            in Elasticsearch is reported as a dict with an "error" key
+
+        Raises:
+            PermissionError: If an audit search is requested by a non-administrator
+            Exception: For Elasticsearch errors
+        """
+        items = []
+        for spec in queries:
+            index = spec.get("index", "repository")
+            limit = spec.get("limit", 20)
+            offset = spec.get("offset", 0)
+            if index == "audit":
+                es_request = self._build_audit_request(
+                    spec["query"], principal, groups, limit, offset
+                )
+                items.append(("audit", es_request, principal, groups))
+            else:
+                es_request = self._build_repository_request(
+                    spec["query"],
+                    principal,
+                    groups,
+                    limit,
+                    offset,
+                    spec.get("source_fields"),
+                )
+                items.append(("nuxeo", es_request, principal, groups))
+
+        responses, bodies = self._execute_msearch(items)
+
+        results = []
+        for (index, _, _, _), response, body in zip(items, responses, bodies):
+            if "error" in response:
+                results.append({"error": response["error"]})
+            elif index == "audit":
+                results.append(self._format_audit_results(response, body.decode("utf-8")))
+            else:
+                results.append(
+                    self._format_repository_results(response, body.decode("utf-8"))
+                )
+        return results
+
+    def check_available(self, index: str) -> None:
+        """Check that an index can be searched through the passthrough.
+
+        Args:
+            index: Index name
+
+        Raises:
+            requests.RequestException: If the index cannot be reached or
+                answers with an error status
+        """
+        response = self._session.post(
+            f"{self.base_url}/{index}/_search",
+            data=_PROBE_BODY,
+            timeout=ES_PROBE_TIMEOUT,
+        )
+        response.raise_for_status()
+
+    async def check_available_async(self, index: str) -> None:
+        """Async variant of check_available, run in a worker thread."""
+        await asyncio.to_thread(self.check_available, index)
+
+    async def search_repository_async(
+        self,
+        query: str,
+        principal: str,
+        groups: List[str],
+        limit: int = 20,
+        offset: int = 0,
+        source_fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of search_repository for use from async tools.
+
+        The request runs in a worker thread on the pooled session, so
+        concurrent searches proceed in parallel without blocking the event loop.
+        """
+        return await asyncio.to_thread(
+            self.search_repository, query, principal, groups, limit, offset, source_fields
+        )
+
+    async def search_audit_async(
+        self,
+        query: str,
+        principal: str,
+        groups: List[str],
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Async variant of search_audit for use from async tools."""
+        return await asyncio.to_thread(
+            self.search_audit, query, principal, groups, limit, offset
+        )
+
+    async def search_batch_async(
+        self,
+        queries: List[Dict[str, Any]],
+        principal: str,
+        groups: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Async variant of search_batch for use from async tools."""
+        return await asyncio.to_thread(self.search_batch, queries, principal, groups)
+
+    def _build_repository_request(
+        self,
+        query: str,
+        principal: str,
+        groups: List[str],
+        limit: int,
+        offset: int,
+        source_fields: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        """Translate a natural language repository search to Elasticsearch DSL."""
+        # Parse natural language to Elasticsearch DSL, copying the cached
+        # top level before pagination is applied to it
+        es_request = dict(
+            _parse_cached(
+                query,
+                "repository",
+                _REPOSITORY_PARSE_FLAGS,
+                (principal, *groups),
+                tuple(source_fields) if source_fields else _REPOSITORY_SOURCE_FIELDS,
+            )
+        )
+
+        # Override pagination if provided
+        if limit:
+            es_request["size"] = limit
+        if offset:
+            es_request["from"] = offset
+        return es_request
+
+    def _build_audit_request(
+        self, query: str, principal: str, groups: List[str], limit: int, offset: int
+    ) -> Dict[str, Any]:
+        """Translate a natural language audit search to Elasticsearch DSL.
+
+        Raises:
+            PermissionError: If user is not administrator
+        """
         # Check admin permission first
-        audit_filter = self.filters["audit"]
+        audit_filter = self._get_filter_for_index("audit")
         if not audit_filter._is_admin(principal, groups):
             raise PermissionError(
                 f"User {principal} is not authorized to query audit logs"
             )
 
-        # Parse natural language to Elasticsearch DSL
-        es_request = self.nl_parser.parse_to_elasticsearch(
-            query, index="audit", include_sort=True, include_pagination=True
+        # Parse natural language to Elasticsearch DSL, copying the cached
+        # top level before pagination is applied to it
+        es_request = dict(
+            _parse_cached(query, "audit", _AUDIT_PARSE_FLAGS, (), _AUDIT_SOURCE_FIELDS)
         )
 
         # Override pagination if provided
@@ -144,14 +447,7 @@ class ElasticsearchPassthrough:
             es_request["size"] = limit
         if offset:
             es_request["from"] = offset
-
-        # Execute query (no ACL filter for audit)
-        response = self.execute_query(
-            index="audit", query=es_request, principal=principal, groups=groups
-        )
-
-        # Format results
-        return self._format_audit_results(response, json.dumps(es_request))
+        return es_request
 
     def execute_query(
         self, index: str, query: Dict[str, Any], principal: str, groups: List[str]
@@ -171,38 +467,26 @@ class ElasticsearchPassthrough:
             PermissionError: If user lacks permission
             Exception: For connection or query errors
         """
-        # Get appropriate filter for index
-        filter_instance = self._get_filter_for_index(index)
+        return self._execute_query(index, query, principal, groups)[0]
 
-        # Extract just the query part if full request provided
-        if "query" in query:
-            filtered_query = filter_instance.apply(query["query"], principal, groups)
-            final_request = query.copy()
-            final_request["query"] = filtered_query
-        else:
-            # Assume the entire dict is the query
-            filtered_query = filter_instance.apply(query, principal, groups)
-            final_request = {"query": filtered_query}
+    def _execute_query(
+        self, index: str, query: Dict[str, Any], principal: str, groups: List[str]
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """Execute a filtered query, also returning the serialized request body."""
+        body = _dumps(self._apply_filter(index, query, principal, groups))
 
         # Execute request against Elasticsearch
         try:
             url = f"{self.base_url}/{index}/_search"
-            headers = {"Content-Type": "application/json"}
-
-            response = requests.post(
-                url, 
-                headers=headers, 
-                data=json.dumps(final_request), 
-                auth=self.auth,  # Add authentication
-                timeout=30
-            )
+
+            response = self._session.post(url, data=body, timeout=30)
 
             if response.status_code != 200:
                 raise Exception(
                     f"Elasticsearch error: {response.status_code} - {response.text}"
                 )
 
-            return response.json()
+            return _loads(response), body
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Elasticsearch connection error: {e}")
@@ -211,6 +495,103 @@ class ElasticsearchPassthrough:
             logger.error(f"Query execution error: {e}")
             raise
 
+    def execute_msearch(
+        self, items: List[Tuple[str, Dict[str, Any], str, List[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Execute several Elasticsearch queries in one _msearch request.
+
+        Args:
+            items: (index, query, principal, groups) for each query; every
+                query is security filtered as in execute_query
+
+        Returns:
+            Raw Elasticsearch response for each query, in order
+
+        Raises:
+            PermissionError: If user lacks permission
+            Exception: For connection or query errors
+        """
+        return self._execute_msearch(items)[0]
+
+    def _execute_msearch(
+        self, items: List[Tuple[str, Dict[str, Any], str, List[str]]]
+    ) -> Tuple[List[Dict[str, Any]], List[bytes]]:
+        """Execute filtered queries via _msearch, also returning each serialized body."""
+        if not items:
+            return [], []
+
+        parts = []
+        bodies = []
+        for index, query, principal, groups in items:
+            request_body = _dumps(self._apply_filter(index, query, principal, groups))
+            bodies.append(request_body)
+            header = self._MSEARCH_HEADERS.get(index)
+            if header is None:
+                header = _dumps({"index": index}) + b"\n"
+            parts.append(header)
+            parts.append(request_body)
+            # NDJSON lines, including the last one, end with a newline
+            parts.append(b"\n")
+        body = b"".join(parts)
+
+        try:
+            response = self._session.post(
+                f"{self.base_url}/_msearch",
+                data=body,
+                headers={"Content-Type": "application/x-ndjson"},
+                timeout=30,
+            )
+
+            if response.status_code != 200:
+                raise Exception(
+                    f"Elasticsearch error: {response.status_code} - {response.text}"
+                )
+
+            return _loads(response)["responses"], bodies
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Elasticsearch connection error: {e}")
+            raise Exception(f"Failed to connect to Elasticsearch: {e}")
+        except Exception as e:
+            logger.error(f"Multi-search execution error: {e}")
+            raise
+
+    def _apply_filter(
+        self, index: str, query: Dict[str, Any], principal: str, groups: List[str]
+    ) -> Dict[str, Any]:
+        """Apply the index's security filter to a query.
+
+        Args:
+            index: Target index name
+            query: Elasticsearch query/request body
+            principal: User principal
+            groups: User groups
+
+        Returns:
+            Filtered request body ready to send
+        """
+        # Get appropriate filter for index
+        filter_instance = self._get_filter_for_index(index)
+
+        # Extract just the query part if full request provided
+        if "query" in query:
+            # Swap in the filtered query without touching the caller's dict
+            filtered_query = filter_instance.apply(query["query"], principal, groups)
+            final_request = dict(query, query=filtered_query)
+        else:
+            # Assume the entire dict is the query
+            filtered_query = filter_instance.apply(query, principal, groups)
+            final_request = {"query": filtered_query}
+        return final_request
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self._session.close()
+
+    def clear_parse_cache(self) -> None:
+        """Clear the cache of translated natural language queries."""
+        _parse_cached.cache_clear()
+
     def _get_filter_for_index(self, index: str) -> SearchRequestFilter:
         """Get the appropriate filter for an index.
 
@@ -220,7 +601,13 @@ class ElasticsearchPassthrough:
         Returns:
             SearchRequestFilter instance
         """
-        return self.filters.get(index, self.filters["nuxeo"])
+        filter_instance = self.filters.get(index)
+        if filter_instance is None:
+            factory = self._FILTER_FACTORIES.get(index)
+            if factory is None:
+                return self._get_filter_for_index("nuxeo")
+            filter_instance = self.filters[index] = factory()
+        return filter_instance
 
     def _format_repository_results(
         self, es_response: Dict[str, Any], translated_query: str
@@ -244,21 +631,16 @@ class ElasticsearchPassthrough:
         results = []
         for hit in hits.get("hits", []):
             source = hit.get("_source", {})
+            get = source.get
             result = {
-                "uid": source.get("uid", source.get("ecm:uuid", "")),
-                "title": source.get("dc:title", ""),
-                "path": source.get("ecm:path", ""),
-                "type": source.get("ecm:primaryType", ""),
-                "modified": source.get("dc:modified", ""),
-                "creator": source.get("dc:creator", ""),
+                "uid": source["uid"] if "uid" in source else get("ecm:uuid", "")
             }
+            for key, field in _REPOSITORY_HIT_FIELDS:
+                result[key] = get(field, "")
 
-            # Add highlights if available
+            # Add highlights if available, flattened across fields
             if "highlight" in hit:
-                highlights = []
-                for field_highlights in hit["highlight"].values():
-                    highlights.extend(field_highlights)
-                result["highlights"] = highlights
+                result["highlights"] = list(chain.from_iterable(hit["highlight"].values()))
 
             results.append(result)
 
@@ -290,18 +672,8 @@ class ElasticsearchPassthrough:
 
         results = []
         for hit in hits.get("hits", []):
-            source = hit.get("_source", {})
-            result = {
-                "id": source.get("id", ""),
-                "eventId": source.get("eventId", ""),
-                "eventDate": source.get("eventDate", ""),
-                "docUUID": source.get("docUUID", ""),
-                "docPath": source.get("docPath", ""),
-                "principalName": source.get("principalName", ""),
-                "category": source.get("category", ""),
-                "comment": source.get("comment", ""),
-            }
-            results.append(result)
+            get = hit.get("_source", {}).get
+            results.append({key: get(field, "") for key, field in _AUDIT_HIT_FIELDS})
 
         return {
             "results": results,
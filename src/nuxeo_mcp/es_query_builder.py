@@ -1,6 +1,16 @@
 """Elasticsearch Query Builder for Nuxeo MCP."""
 
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+@lru_cache(maxsize=256)
+def _acl_filter(principals: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build the ACL terms filter for a set of principals, memoized.
+
+    The returned dict is shared between queries and must not be mutated.
+    """
+    return {"terms": {"ecm:acl": list(principals)}}
 
 
 class ElasticsearchQueryBuilder:
@@ -140,11 +150,16 @@ class ElasticsearchQueryBuilder:
     def apply_acl_filter(
         self, query: Dict[str, Any], user_principals: List[str]
     ) -> Dict[str, Any]:
-        """Apply ACL security filter to a query."""
-        acl_filter = self.terms("ecm:acl", user_principals)
+        """Apply ACL security filter to a query.
+
+        The ACL filter is cached per set of principals and embedded by
+        reference, so it must be treated as read-only by callers.
+        """
+        acl_filter = _acl_filter(tuple(user_principals))
 
         # If query is already a bool query, add to its filter clause
-        if "bool" in query:
+        if "bool" in query and len(query) == 1:
+            query = self._hoist_nested_bool(query)
             bool_query = query["bool"]
             if "filter" in bool_query:
                 if isinstance(bool_query["filter"], list):
@@ -158,6 +173,44 @@ class ElasticsearchQueryBuilder:
             # Wrap in bool query with filter
             return self.bool_query(must=[query], filter=[acl_filter])
 
+    def _hoist_nested_bool(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Collapse a bool whose only clause is a single nested bool in must.
+
+        {"bool": {"must": [{"bool": {...}}], "filter": [...]}} matches the same
+        documents as the inner bool with the outer filters appended, so the
+        extra level is dropped instead of being sent to Elasticsearch.
+        """
+        outer = query["bool"]
+        must = outer.get("must")
+        if (
+            not isinstance(must, list)
+            or len(must) != 1
+            or set(outer) - {"must", "filter"}
+            or set(must[0]) != {"bool"}
+        ):
+            return query
+
+        inner = dict(must[0]["bool"])
+        # A bool with only should clauses requires one of them to match; keep
+        # that once filters are added next to them
+        if (
+            "should" in inner
+            and "must" not in inner
+            and "filter" not in inner
+            and "minimum_should_match" not in inner
+        ):
+            inner["minimum_should_match"] = 1
+
+        outer_filter = outer.get("filter")
+        if outer_filter:
+            if not isinstance(outer_filter, list):
+                outer_filter = [outer_filter]
+            inner_filter = inner.get("filter", [])
+            if not isinstance(inner_filter, list):
+                inner_filter = [inner_filter]
+            inner["filter"] = inner_filter + outer_filter
+        return {"bool": inner}
+
     def build_search_request(
         self,
         query: Dict[str, Any],
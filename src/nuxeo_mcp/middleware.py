@@ -5,10 +5,12 @@ This module provides middleware to handle authentication checks,
 token refresh, and re-authentication prompts.
 """
 
+import asyncio
 import logging
 import functools
+import threading
+import time
 from typing import Any, Callable, Optional
-from datetime import datetime
 
 from nuxeo.exceptions import Unauthorized
 
@@ -17,6 +19,19 @@ from .config import AuthMethod
 
 logger = logging.getLogger(__name__)
 
+# How often authentication is re-verified, in seconds
+AUTH_RECHECK_INTERVAL = 1800.0  # 30 minutes
+
+# Tool results returned when authentication is missing or cannot be restored
+AUTH_REQUIRED_RESPONSE = {
+    "error": "Authentication required. Please authenticate first.",
+    "auth_required": True,
+}
+AUTH_FAILED_RESPONSE = {
+    "error": "Authentication failed. Please check your credentials.",
+    "auth_required": True,
+}
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -35,7 +50,11 @@ class AuthMiddleware:
         """
         self.auth_handler = auth_handler
         self._authenticated = False
-        self._last_auth_check = None
+        # time.monotonic() deadline after which authentication is re-verified
+        self._auth_expiry: Optional[float] = None
+        # Serializes authentication and token refresh across concurrent
+        # calls; reentrant since _reauthenticate calls ensure_authenticated
+        self._auth_lock = threading.RLock()
     
     def require_auth(self, func: Callable) -> Callable:
         """
@@ -60,23 +79,30 @@ class AuthMiddleware:
             except Unauthorized:
                 # Token might be expired, try to refresh or re-authenticate
                 logger.info("Received 401 Unauthorized, attempting to re-authenticate")
-                
-                # Try to refresh token if OAuth2
-                if isinstance(self.auth_handler, OAuth2AuthHandler):
-                    if self.auth_handler.refresh_token():
-                        # Retry the function
-                        return func(*args, **kwargs)
-                
-                # Full re-authentication
-                self._authenticated = False
-                if self.ensure_authenticated():
+                if self._reauthenticate():
                     # Retry the function
                     return func(*args, **kwargs)
-                else:
-                    raise AuthenticationError("Re-authentication failed")
+                raise AuthenticationError("Re-authentication failed")
         
         return wrapper
     
+    def _reauthenticate(self) -> bool:
+        """
+        Recover from a 401 by refreshing the token or authenticating again.
+        
+        Returns:
+            True if the call should be retried, False otherwise
+        """
+        with self._auth_lock:
+            # Try to refresh token if OAuth2
+            if isinstance(self.auth_handler, OAuth2AuthHandler):
+                if self.auth_handler.refresh_token():
+                    return True
+            
+            # Full re-authentication
+            self._authenticated = False
+            return self.ensure_authenticated()
+    
     def ensure_authenticated(self) -> bool:
         """
         Ensure the user is authenticated.
@@ -87,17 +113,22 @@ class AuthMiddleware:
         if self._authenticated and not self._should_recheck_auth():
             return True
         
-        logger.info("Attempting authentication...")
-        
-        # Try to authenticate
-        if self.auth_handler.authenticate():
-            self._authenticated = True
-            self._last_auth_check = datetime.now()
-            return True
-        
-        # Authentication failed
-        self._authenticated = False
-        return False
+        with self._auth_lock:
+            # Another thread may have authenticated while we waited
+            if self._authenticated and not self._should_recheck_auth():
+                return True
+            
+            logger.info("Attempting authentication...")
+            
+            # Try to authenticate
+            if self.auth_handler.authenticate():
+                self._authenticated = True
+                self._auth_expiry = time.monotonic() + AUTH_RECHECK_INTERVAL
+                return True
+            
+            # Authentication failed
+            self._authenticated = False
+            return False
     
     def _should_recheck_auth(self) -> bool:
         """
@@ -106,12 +137,7 @@ class AuthMiddleware:
         Returns:
             True if we should recheck, False otherwise
         """
-        if not self._last_auth_check:
-            return True
-        
-        # Re-check every 30 minutes
-        elapsed = (datetime.now() - self._last_auth_check).total_seconds()
-        return elapsed > 1800  # 30 minutes
+        return self._auth_expiry is None or time.monotonic() >= self._auth_expiry
     
     def get_nuxeo_client(self):
         """
@@ -129,7 +155,7 @@ class AuthMiddleware:
         if hasattr(self.auth_handler, 'logout'):
             self.auth_handler.logout()
         self._authenticated = False
-        self._last_auth_check = None
+        self._auth_expiry = None
         logger.info("Logged out successfully")
     
     def wrap_tool(self, tool_func: Callable) -> Callable:
@@ -142,88 +168,50 @@ class AuthMiddleware:
         Returns:
             Wrapped function with authentication
         """
-        @functools.wraps(tool_func)
-        async def async_wrapper(*args, **kwargs):
-            # Ensure authenticated before tool execution
-            if not self.ensure_authenticated():
-                return {
-                    "error": "Authentication required. Please authenticate first.",
-                    "auth_required": True
-                }
-            
-            try:
-                # Execute the tool
-                result = await tool_func(*args, **kwargs)
-                return result
-            except Unauthorized:
-                # Try to refresh/re-authenticate
-                logger.info("Tool received 401, attempting re-authentication")
-                
-                if isinstance(self.auth_handler, OAuth2AuthHandler):
-                    if self.auth_handler.refresh_token():
-                        # Retry the tool
-                        return await tool_func(*args, **kwargs)
+        if asyncio.iscoroutinefunction(tool_func):
+            @functools.wraps(tool_func)
+            async def async_wrapper(*args, **kwargs):
+                # Ensure authenticated before tool execution; a real check may
+                # hit the network or wait on a browser, so keep it off the loop
+                if not self._authenticated or self._should_recheck_auth():
+                    if not await asyncio.to_thread(self.ensure_authenticated):
+                        return dict(AUTH_REQUIRED_RESPONSE)
                 
-                # Full re-authentication
-                self._authenticated = False
-                if self.ensure_authenticated():
+                try:
+                    # Execute the tool
+                    return await tool_func(*args, **kwargs)
+                except Unauthorized:
+                    logger.info("Tool received 401, attempting re-authentication")
+                    if not await asyncio.to_thread(self._reauthenticate):
+                        return dict(AUTH_FAILED_RESPONSE)
                     # Retry the tool
                     return await tool_func(*args, **kwargs)
-                else:
-                    return {
-                        "error": "Authentication failed. Please check your credentials.",
-                        "auth_required": True
-                    }
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                return {
-                    "error": str(e)
-                }
+                except Exception as e:
+                    logger.error(f"Tool execution failed: {e}")
+                    return {"error": str(e)}
+            
+            return async_wrapper
         
         @functools.wraps(tool_func)
         def sync_wrapper(*args, **kwargs):
             # Ensure authenticated before tool execution
             if not self.ensure_authenticated():
-                return {
-                    "error": "Authentication required. Please authenticate first.",
-                    "auth_required": True
-                }
+                return dict(AUTH_REQUIRED_RESPONSE)
             
             try:
                 # Execute the tool
-                result = tool_func(*args, **kwargs)
-                return result
+                return tool_func(*args, **kwargs)
             except Unauthorized:
-                # Try to refresh/re-authenticate
                 logger.info("Tool received 401, attempting re-authentication")
-                
-                if isinstance(self.auth_handler, OAuth2AuthHandler):
-                    if self.auth_handler.refresh_token():
-                        # Retry the tool
-                        return tool_func(*args, **kwargs)
-                
-                # Full re-authentication
-                self._authenticated = False
-                if self.ensure_authenticated():
-                    # Retry the tool
-                    return tool_func(*args, **kwargs)
-                else:
-                    return {
-                        "error": "Authentication failed. Please check your credentials.",
-                        "auth_required": True
-                    }
+                if not self._reauthenticate():
+                    return dict(AUTH_FAILED_RESPONSE)
+                # Retry the tool
+                return tool_func(*args, **kwargs)
             except Exception as e:
                 logger.error(f"Tool execution failed: {e}")
-                return {
-                    "error": str(e)
-                }
+                return {"error": str(e)}
         
-        # Return appropriate wrapper based on function type
-        import asyncio
-        if asyncio.iscoroutinefunction(tool_func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
 
 class AuthenticationManager:
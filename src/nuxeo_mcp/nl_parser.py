@@ -10,12 +10,27 @@ Note: Since Nuxeo uses MongoDB (DBS), aggregates are not supported in NXQL.
 
 import os
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from .es_query_builder import ElasticsearchQueryBuilder
 
-@dataclass
+
+@dataclass(slots=True, init=False)
 class ParsedQuery:
     """Represents a parsed natural language query"""
 
@@ -25,247 +40,607 @@ class ParsedQuery:
     order_by: Optional[str] = None
     order_direction: Optional[str] = None
     limit: Optional[int] = None
-    explanation: Optional[str] = None
+    # Backs the explanation property; the parser leaves it unset and has it
+    # built on first access, as most callers only need the NXQL
+    _explanation: Optional[str] = field(default=None, repr=False, compare=False)
+    _explain_lazily: bool = field(default=False, repr=False, compare=False)
 
+    def __init__(
+        self,
+        intent: str,
+        doc_type: str,
+        conditions: List[Dict[str, Any]],
+        order_by: Optional[str] = None,
+        order_direction: Optional[str] = None,
+        limit: Optional[int] = None,
+        explanation: Optional[str] = None,
+    ) -> None:
+        self.intent = intent
+        self.doc_type = doc_type
+        self.conditions = conditions
+        self.order_by = order_by
+        self.order_direction = order_direction
+        self.limit = limit
+        self._explanation = explanation
+        self._explain_lazily = False
+
+    @property
+    def explanation(self) -> Optional[str]:
+        """Human-readable explanation of the query"""
+        if self._explain_lazily:
+            self._explain_lazily = False
+            self._explanation = _SHARED_PARSER._generate_explanation(
+                self.intent, self.doc_type, self.conditions, self.order_by, self.limit
+            )
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, value: Optional[str]) -> None:
+        self._explanation = value
+        self._explain_lazily = False
+
+
+@dataclass(slots=True)
+class _QueryContext:
+    """A query in the forms shared by the parser's extraction helpers"""
+
+    original: str  # Query as given, used to slice case-preserving captures
+    lower: str  # Lowercased query, with the same character offsets
+    words: FrozenSet[str]  # Words of the lowercased query
+
+
+def _fuse_patterns(
+    patterns: List[Tuple[str, Any]], flags: int = 0
+) -> Tuple["re.Pattern[str]", Dict[str, Tuple["re.Pattern[str]", Any]]]:
+    """Fuse (pattern, value) pairs into a single regex.
+
+    Each pattern becomes a lookahead alternative anchored at the start of the
+    text, so one ``match()`` call returns the first pattern in list order that
+    matches anywhere, as looping over ``re.search`` would. The winning
+    alternative is reported by ``match.lastgroup``.
+
+    Returns:
+        The fused pattern and a mapping from group name to the compiled
+        individual pattern and its value.
+    """
+    alternatives = []
+    dispatch = {}
+    for i, (pattern, value) in enumerate(patterns):
+        name = f"p{i}"
+        alternatives.append(f"(?=.*?(?P<{name}>{pattern}))")
+        dispatch[name] = (re.compile(pattern, flags), value)
+    return re.compile("|".join(alternatives), flags | re.DOTALL), dispatch
+
+
+# Time expressions mapped to the name of the method building their condition
+_TIME_PATTERN, _TIME_HANDLERS = _fuse_patterns(
+    [
+        # "in the last X" patterns should come first to match before "last X".
+        # The first listed pattern that matches wins, so this order decides
+        # which condition a query with several time expressions gets.
+        (r"\b(?:in|within)\s+(?:the\s+)?last\s+month\b", "_in_last_month"),
+        (r"\b(?:in|within)\s+(?:the\s+)?last\s+year\b", "_in_last_year"),
+        (r"\b(?:in|within)\s+(?:the\s+)?last\s+week\b", "_in_last_week"),
+        # Relative time patterns
+        (r"\b(today)\b", "_today"),
+        (r"\b(yesterday)\b", "_yesterday"),
+        (r"\b(this week)\b", "_this_week"),
+        (r"\b(last week)\b", "_last_week"),
+        (r"\b(this month)\b", "_this_month"),
+        (r"\b(last month)\b", "_last_month"),
+        (r"\b(this year)\b", "_this_year"),
+        (r"\b(last year)\b", "_last_year"),
+        (r"\b(last|past) (\d+) (day|days)\b", "_last_n_days"),
+        (r"\b(last|past) (\d+) (week|weeks)\b", "_last_n_weeks"),
+        (r"\b(last|past) (\d+) (month|months)\b", "_last_n_months"),
+        (r"\b(last|past) (\d+) (year|years)\b", "_last_n_years"),
+        (r"\b(since|after) (\d{4}-\d{2}-\d{2})\b", "_since_date"),
+        (r"\b(before) (\d{4}-\d{2}-\d{2})\b", "_before_date"),
+        (r"\b(between) (\d{4}-\d{2}-\d{2}) and (\d{4}-\d{2}-\d{2})\b", "_between_dates"),
+    ]
+)
+
+@lru_cache(maxsize=256)
+def _modified_within(period: str) -> Dict[str, Any]:
+    """Condition on documents modified within an ISO 8601 period up to now.
+
+    Conditions are cached per period, so every query asking for the same
+    period (e.g. "last 30 days") shares one dict, which must not be modified.
+    """
+    return {"field": "dc:modified", "operator": ">=", "value": f"NOW('-{period}')"}
+
+
+# Conditions of the time expressions that do not depend on the match. They
+# are shared by every parse result and must not be modified.
+_SINCE_TODAY = {"field": "dc:modified", "operator": ">=", "value": "DATE 'TODAY'"}
+_YESTERDAY = {
+    "field": "dc:modified",
+    "operator": "BETWEEN",
+    "value": "DATE 'TODAY-1' AND DATE 'TODAY'",
+}
+_PAST_WEEK = _modified_within("P7D")
+_PREVIOUS_WEEK = {
+    "field": "dc:modified",
+    "operator": "BETWEEN",
+    "value": "NOW('-P14D') AND NOW('-P7D')",
+}
+_PAST_MONTH = _modified_within("P1M")
+_PREVIOUS_MONTH = {
+    "field": "dc:modified",
+    "operator": "BETWEEN",
+    "value": "NOW('-P2M') AND NOW('-P1M')",
+}
+_PAST_YEAR = _modified_within("P1Y")
+_PREVIOUS_YEAR = {
+    "field": "dc:modified",
+    "operator": "BETWEEN",
+    "value": "NOW('-P2Y') AND NOW('-P1Y')",
+}
+
+# Field names accepted in "order by X", mapped to NXQL fields
+_ORDER_FIELD_MAP = {
+    "title": "dc:title",
+    "name": "ecm:name",
+    "created": "dc:created",
+    "modified": "dc:modified",
+    "size": "file:content/length",
+    "path": "ecm:path",
+}
+
+# Human-readable names of NXQL fields used in explanations
+_HUMANIZED_FIELDS = {
+    "dc:title": "title",
+    "dc:description": "description",
+    "dc:creator": "creator",
+    "dc:created": "creation date",
+    "dc:modified": "modification date",
+    "dc:subjects": "subjects",
+    "ecm:name": "name",
+    "ecm:path": "path",
+    "ecm:primaryType": "type",
+    "ecm:currentLifeCycleState": "state",
+    "ecm:fulltext": "content",
+    "ecm:isTrashed": "trash status",
+    "ecm:isVersion": "version status",
+    "ecm:tag": "tags",
+    "file:content/length": "file size",
+    "file:content/name": "file name",
+}
+
+# Common lowercased type names mapped to Nuxeo document types
+_NUXEO_TYPES = {
+    "pdf": "File",
+    "image": "Picture",
+    "picture": "Picture",
+    "video": "Video",
+    "file": "File",
+    "folder": "Folder",
+    "workspace": "Workspace",
+    "note": "Note",
+}
+
+# The query builder is stateless, so one instance serves every parser
+_ES_BUILDER = ElasticsearchQueryBuilder()
+
+# NXQL value formats converted to Elasticsearch date math
+_DATE_VALUE_PATTERN = re.compile(r"DATE '(\d{4}-\d{2}-\d{2})'")
+_PERIOD_VALUE_PATTERN = re.compile(r"NOW\('-P(\d+)([DWMY])")
+_BETWEEN_BOUND_PATTERN = re.compile(
+    r"DATE '(?P<date>[^']*)'|NOW\('-P(?P<amount>\d+)(?P<unit>[DWMY])'\)|TODAY(?:-\d+)?"
+)
+
+# Fields of conditions translated by build_elasticsearch_query
+_TIME_FIELDS = frozenset(["dc:created", "dc:modified"])
+_USER_FIELDS = frozenset(["dc:creator", "dc:contributors", "dc:lastContributor"])
+_TERM_FIELDS = frozenset(["ecm:currentLifeCycleState", "ecm:isTrashed"])
+
+# NXQL comparison operators mapped to Elasticsearch range bounds
+_RANGE_OPERATORS = {">=": "gte", "<=": "lte", ">": "gt", "<": "lt"}
+
+
+def _between_bound(bound: str) -> str:
+    """Convert one bound of an NXQL BETWEEN time value to ES date math.
+
+    Handles ``DATE 'YYYY-MM-DD'``, ``DATE 'TODAY'``, ``DATE 'TODAY-N'`` and
+    ``NOW('-PnX')`` bounds with a single scan; anything else is returned with
+    its quotes removed.
+    """
+    match = _BETWEEN_BOUND_PATTERN.search(bound)
+    if match is None:
+        return bound.replace("'", "")
+    if match.group("amount"):
+        return f"now-{match.group('amount')}{match.group('unit').lower()}"
+    literal = match.group("date")
+    if literal is None:
+        literal = match.group(0)
+    if literal.startswith("TODAY-"):
+        return f"now-{literal[6:]}d/d"
+    if literal == "TODAY":
+        return "now/d"
+    return literal
+
+
+@lru_cache(maxsize=512)
+def _time_range_bounds(operator: str, value: str) -> Optional[Dict[str, str]]:
+    """Convert an NXQL time condition to Elasticsearch range bounds.
+
+    Parsed time conditions come from a small set of values, so the regex work
+    is done once per distinct (operator, value) pair. The returned dict is
+    shared and only meant to be unpacked into a range query.
+
+    Args:
+        operator: NXQL comparison operator of the condition
+        value: NXQL value, e.g. ``DATE '2024-01-15'`` or ``NOW('-P7D')``
+
+    Returns:
+        Range bounds keyed by gte/gt/lte/lt, or None if the value has no
+        Elasticsearch equivalent
+    """
+    if "DATE '" in value:
+        bound = _RANGE_OPERATORS.get(operator, "gte")
+        # Handle special DATE values
+        if "DATE 'TODAY'" in value:
+            return {bound: "now/d"}
+        # Extract the date from DATE 'YYYY-MM-DD' format
+        date_match = _DATE_VALUE_PATTERN.search(value)
+        return {bound: date_match.group(1)} if date_match else None
+
+    # Clean value - remove quotes
+    value = value.strip("'").strip('"')
+    if "NOW('-P" in value:
+        # Extract the period from NOW('-PxD') format
+        period_match = _PERIOD_VALUE_PATTERN.search(value)
+        if period_match:
+            amount = period_match.group(1)
+            unit = period_match.group(2).lower()
+            return {"gte": f"now-{amount}{unit}"}
+        return None
+    if operator in _RANGE_OPERATORS:
+        return {_RANGE_OPERATORS[operator]: value}
+    if operator == "BETWEEN" and " AND " in value:
+        # Handle BETWEEN for NXQL format
+        parts = value.split(" AND ")
+        if len(parts) == 2:
+            return {"gte": _between_bound(parts[0]), "lte": _between_bound(parts[1])}
+    return None
 
-class NaturalLanguageParser:
-    """Parses natural language queries into structured components"""
 
-    def __init__(self):
-        self.doc_type_patterns = {
-            r"\b(invoice|invoices)\b": "Invoice",
-            r"\b(file|files)\b": "File",
-            r"\b(folder|folders|directory|directories)\b": "Folder",
-            r"\b(note|notes)\b": "Note",
-            r"\b(document|documents|doc|docs)\b": "Document",
-            r"\b(workspace|workspaces)\b": "Workspace",
-            r"\b(pdf|pdfs)\b": "File",  # PDFs are typically Files
-            r"\b(image|images|picture|pictures|photo|photos)\b": "Picture",
-            r"\b(video|videos)\b": "Video",
-            r"\b(audio)\b": "Audio",
-        }
+def _lower_preserving_offsets(text: str) -> str:
+    """Lowercase text so that every character keeps its offset.
 
-        self.time_patterns = {
-            # "in the last X" patterns should come first to match before "last X"
-            r"\b(?:in|within)\s+(?:the\s+)?last\s+month\b": self._in_last_month,
-            r"\b(?:in|within)\s+(?:the\s+)?last\s+year\b": self._in_last_year,
-            r"\b(?:in|within)\s+(?:the\s+)?last\s+week\b": self._in_last_week,
-            # Relative time patterns
-            r"\b(today)\b": self._today,
-            r"\b(yesterday)\b": self._yesterday,
-            r"\b(this week)\b": self._this_week,
-            r"\b(last week)\b": self._last_week,
-            r"\b(this month)\b": self._this_month,
-            r"\b(last month)\b": self._last_month,
-            r"\b(this year)\b": self._this_year,
-            r"\b(last year)\b": self._last_year,
-            r"\b(last|past) (\d+) (day|days)\b": self._last_n_days,
-            r"\b(last|past) (\d+) (week|weeks)\b": self._last_n_weeks,
-            r"\b(last|past) (\d+) (month|months)\b": self._last_n_months,
-            r"\b(last|past) (\d+) (year|years)\b": self._last_n_years,
-            r"\b(since|after) (\d{4}-\d{2}-\d{2})\b": self._since_date,
-            r"\b(before) (\d{4}-\d{2}-\d{2})\b": self._before_date,
-            r"\b(between) (\d{4}-\d{2}-\d{2}) and (\d{4}-\d{2}-\d{2})\b": self._between_dates,
-        }
+    A few characters (such as "İ") lowercase to more than one code point;
+    they are left as is so spans matched in the result index the original.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
 
-        self.field_mappings = {
-            "title": "dc:title",
-            "name": "ecm:name",
-            "description": "dc:description",
-            "creator": "dc:creator",
-            "created by": "dc:creator",
-            "author": "dc:creator",
-            "modified": "dc:modified",
-            "created": "dc:created",
-            "updated": "dc:modified",
-            "subject": "dc:subjects",
-            "subjects": "dc:subjects",
-            "tag": "ecm:tag",
-            "tags": "ecm:tag",
-            "type": "ecm:primaryType",
-            "state": "ecm:currentLifeCycleState",
-            "lifecycle": "ecm:currentLifeCycleState",
-            "path": "ecm:path",
-            "in folder": "ecm:path",
-            "under": "ecm:path",
-            "size": "file:content/length",
-            "file size": "file:content/length",
-            "filename": "file:content/name",
-            "file name": "file:content/name",
-        }
 
-        self.state_mappings = {
-            "draft": "project",
-            "published": "approved",
-            "archived": "obsolete",
-            "deleted": "deleted",
-            "trashed": "deleted",
-            "locked": "locked",
-        }
+class NaturalLanguageParser:
+    """Parses natural language queries into structured components"""
+
+    # Words of the query, as delimited by regex word boundaries
+    _WORD_PATTERN = re.compile(r"\w+")
+
+    # Document type words in priority order: the first type found in the query wins
+    _DOC_TYPES = (
+        (frozenset(["invoice", "invoices"]), "Invoice"),
+        (frozenset(["file", "files"]), "File"),
+        (frozenset(["folder", "folders", "directory", "directories"]), "Folder"),
+        (frozenset(["note", "notes"]), "Note"),
+        (frozenset(["document", "documents", "doc", "docs"]), "Document"),
+        (frozenset(["workspace", "workspaces"]), "Workspace"),
+        (frozenset(["pdf", "pdfs"]), "File"),  # PDFs are typically Files
+        (frozenset(["image", "images", "picture", "pictures", "photo", "photos"]), "Picture"),
+        (frozenset(["video", "videos"]), "Video"),
+        (frozenset(["audio"]), "Audio"),
+    )
+
+    # Every time pattern below contains one of these words
+    _TIME_WORDS = frozenset(
+        ["today", "yesterday", "this", "last", "past", "since", "after", "before", "between"]
+    )
+
+
+    # Natural language field names mapped to NXQL properties
+    field_mappings: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "title": "dc:title",
+        "name": "ecm:name",
+        "description": "dc:description",
+        "creator": "dc:creator",
+        "created by": "dc:creator",
+        "author": "dc:creator",
+        "modified": "dc:modified",
+        "created": "dc:created",
+        "updated": "dc:modified",
+        "subject": "dc:subjects",
+        "subjects": "dc:subjects",
+        "tag": "ecm:tag",
+        "tags": "ecm:tag",
+        "type": "ecm:primaryType",
+        "state": "ecm:currentLifeCycleState",
+        "lifecycle": "ecm:currentLifeCycleState",
+        "path": "ecm:path",
+        "in folder": "ecm:path",
+        "under": "ecm:path",
+        "size": "file:content/length",
+        "file size": "file:content/length",
+        "filename": "file:content/name",
+        "file name": "file:content/name",
+    })
+
+    # Natural language lifecycle states mapped to Nuxeo states
+    state_mappings: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "draft": "project",
+        "published": "approved",
+        "archived": "obsolete",
+        "deleted": "deleted",
+        "trashed": "deleted",
+        "locked": "locked",
+    })
+
+    # Patterns used by the extraction helpers, compiled once at import time.
+    # All patterns are lowercase and run against the lowercased query, which
+    # avoids case folding while matching; captured text that must keep its
+    # case is sliced from the original query at the same offsets.
+    _USER_PATTERNS = (
+        (re.compile(r'(?:created by|by user|authored by)\s+["\']?(\w+)["\']?'), "dc:creator"),
+        (re.compile(r'(?:modified by|updated by)\s+["\']?(\w+)["\']?'), "dc:lastContributor"),
+        (re.compile(r"(\w+)'s\s+(?:documents?|files?)"), "dc:creator"),
+        (re.compile(r'\bby\s+["\']?(\w+)["\']?'), "dc:creator"),  # Simple "by USER" pattern
+    )
+    _FROM_USER_PATTERN = re.compile(r'from\s+["\']?(\w+)["\']?')
+    # Words captured after "by"/"from" that start a time expression, not a username
+    _TIME_KEYWORDS = frozenset(["last", "this", "today", "yesterday", "the"])
+
+    _TITLE_PATTERNS = (
+        (re.compile(r'(?:named|called|titled|with title)\s+["\']([^"\']+)["\']'), "="),
+        (re.compile(r'(?:with title containing|title contains?|name contains?)\s+["\']([^"\']+)["\']'), "LIKE"),
+        (re.compile(r'(?:title starts? with|name starts? with)\s+["\']([^"\']+)["\']'), "LIKE"),
+    )
+
+    _TITLE_QUERY_PATTERN = re.compile(r'\b(?:title|name)\s+(?:containing|contains?|starts?)\b')
+    _FULLTEXT_PATTERNS = (
+        re.compile(r'(?:containing|with content|with text|search for)\s+["\']([^"\']+)["\']'),
+        re.compile(
+            r"(?:containing|with content|with text|search for)\s+(\w+(?:\s+\w+)*?)(?:\s+(?:and|or|from|by|created|modified|in|under|not)|$)"
+        ),
+    )
+
+    # Fulltext keywords containing any of these are time or user related
+    _FULLTEXT_SKIP_PATTERN = re.compile(r"today|yesterday|week|month|year|created|modified|by")
+
+    _PATH_PATTERNS = (
+        re.compile(r'(?:in folder|under|in path|in)\s+["\']([^"\']+)["\']'),
+        re.compile(r"(?:in folder|under|in path|in)\s+(/[\w\-/]+)"),
+        re.compile(r'(?:from|within)\s+["\']([^"\']+)["\']'),
+        re.compile(r"(?:from|within)\s+(/[\w\-/]+)"),
+    )
+
+    _ORDER_BY_PATTERN = re.compile(
+        r"(?:order by|sort by|sorted by)\s+(\w+)(?:\s+(asc|desc|ascending|descending))?"
+    )
+    # Ordering keywords, checked in order as substrings of the lowercased query
+    _ORDER_KEYWORDS = {
+        "latest": ("dc:modified", "DESC"),
+        "newest": ("dc:modified", "DESC"),
+        "most recent": ("dc:modified", "DESC"),
+        "oldest": ("dc:modified", "ASC"),
+        "earliest": ("dc:modified", "ASC"),
+        "alphabetical": ("dc:title", "ASC"),  # Also matches "alphabetically"
+        "by name": ("ecm:name", "ASC"),
+        "by size": ("file:content/length", "DESC"),
+        "largest": ("file:content/length", "DESC"),
+        "smallest": ("file:content/length", "ASC"),
+    }
+
+    _LIMIT_PATTERNS = (
+        re.compile(r"(?:first|top|limit)\s+(\d+)"),
+        re.compile(r"(\d+)\s+(?:results?|documents?|files?|items?)"),
+        re.compile(r"(\d+)\s+(?:recent|latest|newest|oldest)"),  # Handle "5 recent documents"
+        re.compile(r"show\s+(?:me\s+)?(\d+)"),  # Handle "show me 5 ..."
+    )
+
+    # Queries made of just one of these are not turned into fulltext searches
+    _DOC_TYPE_KEYWORDS = frozenset(
+        ["documents", "files", "folders", "pictures", "images", "videos", "notes", "workspaces", "pdfs", "all"]
+    )
+    _COMMAND_PREFIX_PATTERN = re.compile(r"(?:find|search|get|show|list) ")
+
+    # Listing queries made only of words no condition extractor reacts to
+    _LISTING_PATTERN = re.compile(
+        r"\s*(?:(?:show(?:\s+me)?|find|list|get)\s+)?(?:(?:the|all)\s+)?(?:\d+\s+)?"
+        r"(?:(?:latest|newest|most\s+recent|recent)\s+)?"
+        r"(?:documents?|docs?|files?|folders?|notes?|pictures?|images?|photos?"
+        r"|videos?|pdfs?|workspaces?|invoices?)\s*"
+    )
+
+    # Audit-specific keywords, matched as substrings of the lowercased query
+    _AUDIT_KEYWORDS_PATTERN = re.compile(
+        "|".join(
+            re.escape(keyword)
+            for keyword in [
+                "audit",
+                "log",
+                "event",
+                "activity",
+                "deletion",
+                "modification",
+                "who deleted",
+                "who modified",
+                "who created",
+                "what did",
+            ]
+        )
+    )
 
     def parse(self, query: str) -> ParsedQuery:
-        """Parse a natural language query into structured components"""
-        query_lower = query.lower()
+        """Parse a natural language query into structured components.
+
+        Results are memoized per query string and shared between callers,
+        so the returned ParsedQuery must not be modified.
+        """
+        return _parse_cached(query)
+
+    def _parse_impl(self, query: str) -> ParsedQuery:
+        """Parse a query without consulting the cache"""
+        query_lower = _lower_preserving_offsets(query)
+        # Lowercase and tokenize once; every extraction helper reads the same
+        # context, and keyword checks become set lookups, not string scans
+        ctx = _QueryContext(
+            original=query,
+            lower=query_lower,
+            words=frozenset(self._WORD_PATTERN.findall(query_lower)),
+        )
 
         # Detect intent (MongoDB doesn't support aggregates)
         intent = self._detect_intent(query_lower)
 
         # Extract document type
-        doc_type = self._extract_doc_type(query_lower)
+        doc_type = self._extract_doc_type(ctx)
 
         # Extract conditions
-        conditions = self._extract_conditions(query, query_lower)
+        conditions = self._extract_conditions(ctx)
 
         # Extract ordering
-        order_by, order_direction = self._extract_ordering(query_lower)
+        order_by, order_direction = self._extract_ordering(ctx)
 
         # Extract limit
-        limit = self._extract_limit(query_lower)
-
-        # Generate explanation
-        explanation = self._generate_explanation(
-            intent, doc_type, conditions, order_by, limit
-        )
+        limit = self._extract_limit(ctx)
 
-        return ParsedQuery(
+        parsed = ParsedQuery(
             intent=intent,
             doc_type=doc_type,
             conditions=conditions,
             order_by=order_by,
             order_direction=order_direction,
             limit=limit,
-            explanation=explanation,
         )
+        # The explanation is only generated if it is asked for
+        parsed._explain_lazily = True
+        return parsed
 
     def _detect_intent(self, query: str) -> str:
         """Detect the intent of the query"""
-        # Since MongoDB doesn't support aggregates, we only support search and count
-        if any(word in query for word in ["count", "how many", "number of"]):
-            # Count is not directly supported in MongoDB NXQL, but we can indicate the intent
-            return "search"  # Will need to count results client-side
-        else:
-            return "search"
-
-    def _extract_doc_type(self, query: str) -> str:
-        """Extract document type from query"""
-        for pattern, doc_type in self.doc_type_patterns.items():
-            if re.search(pattern, query, re.IGNORECASE):
+        # Since MongoDB doesn't support aggregates, count queries ("count",
+        # "how many", "number of") are also searches whose results are counted
+        # client-side, so there is nothing to detect
+        return "search"
+
+    def _extract_doc_type(self, ctx: _QueryContext) -> str:
+        """Extract document type from the words of the query"""
+        for type_words, doc_type in self._DOC_TYPES:
+            if not ctx.words.isdisjoint(type_words):
                 return doc_type
         return "Document"  # Default to Document
 
-    def _extract_conditions(
-        self, original_query: str, query_lower: str
-    ) -> List[Dict[str, Any]]:
+    def _extract_conditions(self, ctx: _QueryContext) -> List[Dict[str, Any]]:
         """Extract WHERE conditions from the query"""
+        # Plain listing queries ("show me 5 recent files") cannot match any of
+        # the extractors below, so go straight to the fallback
+        if self._LISTING_PATTERN.fullmatch(ctx.lower):
+            return self._fallback_conditions(ctx)
+
         conditions = []
 
         # Extract time conditions
-        time_condition = self._extract_time_condition(query_lower)
+        time_condition = self._extract_time_condition(ctx)
         if time_condition:
             conditions.append(time_condition)
 
         # Extract user conditions
-        user_condition = self._extract_user_condition(original_query, query_lower)
+        user_condition = self._extract_user_condition(ctx)
         if user_condition:
             conditions.append(user_condition)
 
         # Extract title/name conditions
-        title_condition = self._extract_title_condition(original_query, query_lower)
+        title_condition = self._extract_title_condition(ctx)
         if title_condition:
             conditions.append(title_condition)
 
         # Extract fulltext search
-        fulltext_condition = self._extract_fulltext_condition(
-            original_query, query_lower
-        )
+        fulltext_condition = self._extract_fulltext_condition(ctx)
         if fulltext_condition:
             conditions.append(fulltext_condition)
 
         # Extract path conditions
-        path_condition = self._extract_path_condition(original_query, query_lower)
+        path_condition = self._extract_path_condition(ctx)
         if path_condition:
             conditions.append(path_condition)
 
         # Extract state conditions
-        state_condition = self._extract_state_condition(query_lower)
+        state_condition = self._extract_state_condition(ctx)
         if state_condition:
             conditions.append(state_condition)
 
         # Extract special conditions (trash, versions, etc.)
-        special_conditions = self._extract_special_conditions(query_lower)
+        special_conditions = self._extract_special_conditions(ctx)
         conditions.extend(special_conditions)
         
-        # Fallback: If no conditions were found and the query doesn't just specify a document type,
-        # treat it as a fulltext search
-        if not conditions and original_query:
-            # Check if the query is just a document type keyword
-            doc_type_keywords = [
-                "documents", "files", "folders", "pictures", "images", "videos", 
-                "notes", "workspaces", "pdfs", "all"
-            ]
-            
-            # Clean the query for comparison
-            clean_query = original_query.strip().lower()
-            
-            # If it's not just a document type keyword, treat it as a search term
-            if clean_query not in doc_type_keywords and not clean_query.startswith("all "):
-                # Remove common prefixes that might be in the query
-                search_term = original_query
-                for prefix in ["find", "search", "get", "show", "list"]:
-                    if search_term.lower().startswith(prefix + " "):
-                        search_term = search_term[len(prefix)+1:].strip()
-                        break
-                
-                # Add fulltext search condition for the remaining text
-                if search_term and search_term not in doc_type_keywords:
-                    conditions.append({
-                        "field": "ecm:fulltext",
-                        "operator": "=",
-                        "value": f"'{search_term}'"
-                    })
+        # Fallback: If no conditions were found, treat the query as a fulltext search
+        if not conditions and ctx.original:
+            conditions = self._fallback_conditions(ctx)
 
         return conditions
 
-    def _extract_time_condition(self, query: str) -> Optional[Dict[str, Any]]:
-        """Extract time-based conditions"""
-        for pattern, handler in self.time_patterns.items():
-            match = re.search(pattern, query, re.IGNORECASE)
+    def _fallback_conditions(self, ctx: _QueryContext) -> List[Dict[str, Any]]:
+        """Build the fulltext condition used when no other condition was found"""
+        # Clean the query for comparison
+        clean_query = ctx.lower.strip()
+        
+        # If it's not just a document type keyword, treat it as a search term
+        if clean_query not in self._DOC_TYPE_KEYWORDS and not clean_query.startswith("all "):
+            # Remove a common command prefix that might be in the query
+            search_term = ctx.original
+            match = self._COMMAND_PREFIX_PATTERN.match(ctx.lower)
             if match:
-                return handler(match)
+                search_term = ctx.original[match.end():].strip()
+            
+            # Add fulltext search condition for the remaining text
+            if search_term and search_term not in self._DOC_TYPE_KEYWORDS:
+                return [{
+                    "field": "ecm:fulltext",
+                    "operator": "=",
+                    "value": f"'{search_term}'"
+                }]
+
+        return []
+
+    def _extract_time_condition(self, ctx: _QueryContext) -> Optional[Dict[str, Any]]:
+        """Extract time-based conditions"""
+        query = ctx.lower
+        # Skip the fused pattern, whose failing match is the costliest, when
+        # no time word is present
+        if ctx.words.isdisjoint(self._TIME_WORDS):
+            return None
+
+        match = _TIME_PATTERN.match(query)
+        if match:
+            # Every alternative is a named group, so lastgroup is always set
+            name = cast(str, match.lastgroup)
+            # Re-run the winning pattern in place so handlers see its own groups
+            pattern, handler_name = _TIME_HANDLERS[name]
+            handler: Callable[..., Dict[str, Any]] = getattr(self, handler_name)
+            return handler(pattern.match(query, match.start(name)))
         return None
 
     def _extract_user_condition(
-        self, original_query: str, query_lower: str
+        self, ctx: _QueryContext
     ) -> Optional[Dict[str, Any]]:
         """Extract user-based conditions"""
-        # Skip if the word after 'from' is a time-related keyword
-        time_keywords = ["last", "this", "today", "yesterday", "the"]
-
-        patterns = [
-            (r'(?:created by|by user|authored by)\s+["\']?(\w+)["\']?', "dc:creator"),
-            (r'(?:modified by|updated by)\s+["\']?(\w+)["\']?', "dc:lastContributor"),
-            (r"(\w+)'s\s+(?:documents?|files?)", "dc:creator"),
-            (r'\bby\s+["\']?(\w+)["\']?', "dc:creator"),  # Simple "by USER" pattern
-        ]
-
-        for pattern, field in patterns:
-            match = re.search(
-                pattern,
-                query_lower if field == "dc:creator" else original_query,
-                re.IGNORECASE,
-            )
-            if match:
-                username = re.search(pattern, original_query, re.IGNORECASE).group(1)
-                # Don't treat time keywords as usernames
-                if username.lower() not in time_keywords:
-                    return {"field": field, "operator": "=", "value": f"'{username}'"}
+        for pattern, field in self._USER_PATTERNS:
+            match = pattern.search(ctx.lower)
+            # Don't treat time keywords as usernames
+            if match and match.group(1) not in self._TIME_KEYWORDS:
+                username = ctx.original[match.start(1):match.end(1)]
+                return {"field": field, "operator": "=", "value": f"'{username}'"}
 
         # Special handling for 'from' pattern - only if not followed by time keyword
-        from_pattern = r'from\s+["\']?(\w+)["\']?'
-        match = re.search(from_pattern, query_lower, re.IGNORECASE)
+        match = self._FROM_USER_PATTERN.search(ctx.lower)
         if match:
-            username = re.search(from_pattern, original_query, re.IGNORECASE).group(1)
-            if username.lower() not in time_keywords:
+            if match.group(1) not in self._TIME_KEYWORDS:
+                username = ctx.original[match.start(1):match.end(1)]
                 return {
                     "field": "dc:creator",
                     "operator": "=",
@@ -275,21 +650,24 @@ class NaturalLanguageParser:
         return None
 
     def _extract_title_condition(
-        self, original_query: str, query_lower: str
+        self, ctx: _QueryContext
     ) -> Optional[Dict[str, Any]]:
         """Extract title/name conditions"""
-        patterns = [
-            (r'(?:named|called|titled|with title)\s+["\']([^"\']+)["\']', "="),
-            (r'(?:with title containing|title contains?|name contains?)\s+["\']([^"\']+)["\']', "LIKE"),
-            (r'(?:title starts? with|name starts? with)\s+["\']([^"\']+)["\']', "LIKE"),
-        ]
-
-        for pattern, operator in patterns:
-            match = re.search(pattern, original_query, re.IGNORECASE)
+        # Every title pattern needs a quoted value and a title/name keyword;
+        # plain substring checks rule out most queries before any regex runs
+        if "'" not in ctx.original and '"' not in ctx.original:
+            return None
+        if not (
+            "title" in ctx.lower or "name" in ctx.lower or "called" in ctx.lower
+        ):
+            return None
+
+        for pattern, operator in self._TITLE_PATTERNS:
+            match = pattern.search(ctx.lower)
             if match:
-                title = match.group(1)
+                title = ctx.original[match.start(1):match.end(1)]
                 if operator == "LIKE":
-                    if "starts with" in query_lower:
+                    if "starts with" in ctx.lower:
                         value = f"'{title}%'"
                     else:
                         value = f"'%{title}%'"
@@ -300,34 +678,30 @@ class NaturalLanguageParser:
         return None
 
     def _extract_fulltext_condition(
-        self, original_query: str, query_lower: str
+        self, ctx: _QueryContext
     ) -> Optional[Dict[str, Any]]:
         """Extract fulltext search conditions"""
         # Skip if this is a title/name query
-        if re.search(r'\b(?:title|name)\s+(?:containing|contains?|starts?)\b', query_lower):
+        if ("title" in ctx.lower or "name" in ctx.lower) and (
+            self._TITLE_QUERY_PATTERN.search(ctx.lower)
+        ):
+            return None
+
+        # Every fulltext pattern starts with one of these phrases
+        if not (
+            "containing" in ctx.lower
+            or "with content" in ctx.lower
+            or "with text" in ctx.lower
+            or "search for" in ctx.lower
+        ):
             return None
-            
-        patterns = [
-            r'(?:containing|with content|with text|search for)\s+["\']([^"\']+)["\']',
-            r"(?:containing|with content|with text|search for)\s+(\w+(?:\s+\w+)*?)(?:\s+(?:and|or|from|by|created|modified|in|under|not)|$)",
-        ]
 
-        for pattern in patterns:
-            match = re.search(pattern, original_query, re.IGNORECASE)
+        for pattern in self._FULLTEXT_PATTERNS:
+            match = pattern.search(ctx.lower)
             if match:
-                keywords = match.group(1).strip()
                 # Don't create fulltext condition if keywords are time-related or user-related
-                skip_words = [
-                    "today",
-                    "yesterday",
-                    "week",
-                    "month",
-                    "year",
-                    "created",
-                    "modified",
-                    "by",
-                ]
-                if not any(word in keywords.lower() for word in skip_words):
+                if not self._FULLTEXT_SKIP_PATTERN.search(match.group(1)):
+                    keywords = ctx.original[match.start(1):match.end(1)].strip()
                     return {
                         "field": "ecm:fulltext",
                         "operator": "=",
@@ -336,20 +710,13 @@ class NaturalLanguageParser:
         return None
 
     def _extract_path_condition(
-        self, original_query: str, query_lower: str
+        self, ctx: _QueryContext
     ) -> Optional[Dict[str, Any]]:
         """Extract path conditions"""
-        patterns = [
-            r'(?:in folder|under|in path|in)\s+["\']([^"\']+)["\']',
-            r"(?:in folder|under|in path|in)\s+(/[\w\-/]+)",
-            r'(?:from|within)\s+["\']([^"\']+)["\']',
-            r"(?:from|within)\s+(/[\w\-/]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, original_query, re.IGNORECASE)
+        for pattern in self._PATH_PATTERNS:
+            match = pattern.search(ctx.lower)
             if match:
-                path = match.group(1)
+                path = ctx.original[match.start(1):match.end(1)]
                 if not path.startswith("/"):
                     path = "/" + path
                 return {
@@ -359,27 +726,28 @@ class NaturalLanguageParser:
                 }
         return None
 
-    def _extract_state_condition(self, query: str) -> Optional[Dict[str, Any]]:
+    def _extract_state_condition(
+        self, ctx: _QueryContext
+    ) -> Optional[Dict[str, Any]]:
         """Extract lifecycle state conditions"""
+        query = ctx.lower
         # Check for "not deleted" or "not trashed" first to avoid conflicts
         if "not deleted" in query or "not trashed" in query:
             # This will be handled by _extract_special_conditions
             return None
             
-        for state_keyword, state_value in self.state_mappings.items():
+        # A handful of substring checks beats a regex scan here; the first
+        # keyword found selects its shared prebuilt condition
+        for state_keyword, condition in _STATE_CONDITIONS.items():
             if state_keyword in query:
-                if state_keyword in ["deleted", "trashed"]:
-                    return {"field": "ecm:isTrashed", "operator": "=", "value": "1"}
-                else:
-                    return {
-                        "field": "ecm:currentLifeCycleState",
-                        "operator": "=",
-                        "value": f"'{state_value}'",
-                    }
+                return condition
         return None
 
-    def _extract_special_conditions(self, query: str) -> List[Dict[str, Any]]:
+    def _extract_special_conditions(
+        self, ctx: _QueryContext
+    ) -> List[Dict[str, Any]]:
         """Extract special conditions like versions, proxies, etc."""
+        query = ctx.lower
         conditions = []
 
         # Not in trash (when looking for active documents)
@@ -424,67 +792,37 @@ class NaturalLanguageParser:
 
         return conditions
 
-    def _extract_ordering(self, query: str) -> Tuple[Optional[str], Optional[str]]:
+    def _extract_ordering(
+        self, ctx: _QueryContext
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Extract ORDER BY clause"""
-        order_patterns = [
-            (
-                r"(?:order by|sort by|sorted by)\s+(\w+)(?:\s+(asc|desc|ascending|descending))?",
-                None,
-            ),
-            (r"(?:latest|newest|most recent)", ("dc:modified", "DESC")),
-            (r"(?:oldest|earliest)", ("dc:modified", "ASC")),
-            (r"(?:alphabetical|alphabetically)", ("dc:title", "ASC")),
-            (r"(?:by name)", ("ecm:name", "ASC")),
-            (r"(?:by size|largest)", ("file:content/length", "DESC")),
-            (r"(?:smallest)", ("file:content/length", "ASC")),
-        ]
-
-        for pattern, default_order in order_patterns:
-            if default_order:
-                if re.search(pattern, query, re.IGNORECASE):
-                    return default_order
-            else:
-                match = re.search(pattern, query, re.IGNORECASE)
-                if match:
-                    field = match.group(1).lower()
-                    direction = (
-                        match.group(2).upper()
-                        if len(match.groups()) > 1 and match.group(2)
-                        else "ASC"
-                    )
+        query = ctx.lower
+        match = self._ORDER_BY_PATTERN.search(query)
+        if match:
+            field = match.group(1).lower()
+            direction = match.group(2).upper() if match.group(2) else "ASC"
 
-                    # Map field names to NXQL fields
-                    field_map = {
-                        "title": "dc:title",
-                        "name": "ecm:name",
-                        "created": "dc:created",
-                        "modified": "dc:modified",
-                        "size": "file:content/length",
-                        "path": "ecm:path",
-                    }
+            # Map field names to NXQL fields
+            nxql_field = _ORDER_FIELD_MAP.get(field, f"dc:{field}")
 
-                    nxql_field = field_map.get(field, f"dc:{field}")
+            if "desc" in direction.lower():
+                direction = "DESC"
+            else:
+                direction = "ASC"
 
-                    if "desc" in direction.lower():
-                        direction = "DESC"
-                    else:
-                        direction = "ASC"
+            return (nxql_field, direction)
 
-                    return (nxql_field, direction)
+        for keyword, order in self._ORDER_KEYWORDS.items():
+            if keyword in query:
+                return order
 
         return (None, None)
 
-    def _extract_limit(self, query: str) -> Optional[int]:
+    def _extract_limit(self, ctx: _QueryContext) -> Optional[int]:
         """Extract LIMIT clause"""
-        patterns = [
-            r"(?:first|top|limit)\s+(\d+)",
-            r"(\d+)\s+(?:results?|documents?|files?|items?)",
-            r"(\d+)\s+(?:recent|latest|newest|oldest)",  # Handle "5 recent documents"
-            r"show\s+(?:me\s+)?(\d+)",  # Handle "show me 5 ..."
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        query = ctx.lower
+        for pattern in self._LIMIT_PATTERNS:
+            match = pattern.search(query)
             if match:
                 return int(match.group(1))
 
@@ -532,105 +870,67 @@ class NaturalLanguageParser:
 
     def _humanize_field(self, field: str) -> str:
         """Convert NXQL field name to human-readable form"""
-        field_names = {
-            "dc:title": "title",
-            "dc:description": "description",
-            "dc:creator": "creator",
-            "dc:created": "creation date",
-            "dc:modified": "modification date",
-            "dc:subjects": "subjects",
-            "ecm:name": "name",
-            "ecm:path": "path",
-            "ecm:primaryType": "type",
-            "ecm:currentLifeCycleState": "state",
-            "ecm:fulltext": "content",
-            "ecm:isTrashed": "trash status",
-            "ecm:isVersion": "version status",
-            "ecm:tag": "tags",
-            "file:content/length": "file size",
-            "file:content/name": "file name",
-        }
-        return field_names.get(field, field)
+        return _HUMANIZED_FIELDS.get(field, field)
 
     # Time handler methods
-    def _today(self, match) -> Dict[str, Any]:
-        return {"field": "dc:modified", "operator": ">=", "value": "DATE 'TODAY'"}
+    def _today(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _SINCE_TODAY
 
-    def _yesterday(self, match) -> Dict[str, Any]:
-        return {
-            "field": "dc:modified",
-            "operator": "BETWEEN",
-            "value": "DATE 'TODAY-1' AND DATE 'TODAY'",
-        }
+    def _yesterday(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _YESTERDAY
 
-    def _this_week(self, match) -> Dict[str, Any]:
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P7D')"}
+    def _this_week(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PAST_WEEK
 
-    def _last_week(self, match) -> Dict[str, Any]:
-        return {
-            "field": "dc:modified",
-            "operator": "BETWEEN",
-            "value": "NOW('-P14D') AND NOW('-P7D')",
-        }
+    def _last_week(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PREVIOUS_WEEK
 
-    def _this_month(self, match) -> Dict[str, Any]:
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P1M')"}
+    def _this_month(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PAST_MONTH
 
-    def _last_month(self, match) -> Dict[str, Any]:
-        return {
-            "field": "dc:modified",
-            "operator": "BETWEEN",
-            "value": "NOW('-P2M') AND NOW('-P1M')",
-        }
+    def _last_month(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PREVIOUS_MONTH
 
-    def _this_year(self, match) -> Dict[str, Any]:
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P1Y')"}
+    def _this_year(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PAST_YEAR
 
-    def _last_year(self, match) -> Dict[str, Any]:
-        return {
-            "field": "dc:modified",
-            "operator": "BETWEEN",
-            "value": "NOW('-P2Y') AND NOW('-P1Y')",
-        }
+    def _last_year(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _PREVIOUS_YEAR
 
-    def _in_last_month(self, match) -> Dict[str, Any]:
+    def _in_last_month(self, match: "re.Match[str]") -> Dict[str, Any]:
         """Handle 'in the last month' - documents from the last month up to now"""
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P1M')"}
+        return _PAST_MONTH
 
-    def _in_last_year(self, match) -> Dict[str, Any]:
+    def _in_last_year(self, match: "re.Match[str]") -> Dict[str, Any]:
         """Handle 'in the last year' - documents from the last year up to now"""
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P1Y')"}
+        return _PAST_YEAR
 
-    def _in_last_week(self, match) -> Dict[str, Any]:
+    def _in_last_week(self, match: "re.Match[str]") -> Dict[str, Any]:
         """Handle 'in the last week' - documents from the last week up to now"""
-        return {"field": "dc:modified", "operator": ">=", "value": "NOW('-P7D')"}
+        return _PAST_WEEK
 
-    def _last_n_days(self, match) -> Dict[str, Any]:
-        n = match.group(2)
-        return {"field": "dc:modified", "operator": ">=", "value": f"NOW('-P{n}D')"}
+    def _last_n_days(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _modified_within(f"P{match.group(2)}D")
 
-    def _last_n_weeks(self, match) -> Dict[str, Any]:
-        n = int(match.group(2))
-        days = n * 7
-        return {"field": "dc:modified", "operator": ">=", "value": f"NOW('-P{days}D')"}
+    def _last_n_weeks(self, match: "re.Match[str]") -> Dict[str, Any]:
+        days = int(match.group(2)) * 7
+        return _modified_within(f"P{days}D")
 
-    def _last_n_months(self, match) -> Dict[str, Any]:
-        n = match.group(2)
-        return {"field": "dc:modified", "operator": ">=", "value": f"NOW('-P{n}M')"}
+    def _last_n_months(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _modified_within(f"P{match.group(2)}M")
 
-    def _last_n_years(self, match) -> Dict[str, Any]:
-        n = match.group(2)
-        return {"field": "dc:modified", "operator": ">=", "value": f"NOW('-P{n}Y')"}
+    def _last_n_years(self, match: "re.Match[str]") -> Dict[str, Any]:
+        return _modified_within(f"P{match.group(2)}Y")
 
-    def _since_date(self, match) -> Dict[str, Any]:
+    def _since_date(self, match: "re.Match[str]") -> Dict[str, Any]:
         date = match.group(2)
         return {"field": "dc:modified", "operator": ">=", "value": f"DATE '{date}'"}
 
-    def _before_date(self, match) -> Dict[str, Any]:
+    def _before_date(self, match: "re.Match[str]") -> Dict[str, Any]:
         date = match.group(2)
         return {"field": "dc:modified", "operator": "<", "value": f"DATE '{date}'"}
 
-    def _between_dates(self, match) -> Dict[str, Any]:
+    def _between_dates(self, match: "re.Match[str]") -> Dict[str, Any]:
         date1 = match.group(2)
         date2 = match.group(3)
         return {
@@ -641,25 +941,8 @@ class NaturalLanguageParser:
 
     def detect_search_intent(self, query: str) -> str:
         """Detect whether query is for repository or audit index."""
-        query_lower = query.lower()
-
-        # Audit-specific keywords
-        audit_keywords = [
-            "audit",
-            "log",
-            "event",
-            "activity",
-            "deletion",
-            "modification",
-            "who deleted",
-            "who modified",
-            "who created",
-            "what did",
-        ]
-
-        for keyword in audit_keywords:
-            if keyword in query_lower:
-                return "audit"
+        if self._AUDIT_KEYWORDS_PATTERN.search(query.lower()):
+            return "audit"
 
         # Default to repository search
         return "repository"
@@ -678,14 +961,17 @@ class NaturalLanguageParser:
         source_excludes: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Parse natural language query to Elasticsearch DSL."""
-        from .es_query_builder import ElasticsearchQueryBuilder
+        es_builder = _ES_BUILDER
 
         # Parse the natural language query
         parsed = self.parse(query)
 
-        # Build Elasticsearch query
-        es_builder = ElasticsearchQueryBuilder()
-        es_query = self.build_elasticsearch_query(parsed, index)
+        sort = None
+        if include_sort and parsed.order_by:
+            sort = [{parsed.order_by: {"order": parsed.order_direction or "ASC"}}]
+
+        # Build Elasticsearch query; sorted results never use relevance scores
+        es_query = self.build_elasticsearch_query(parsed, index, scored=sort is None)
 
         # Apply ACL filter if requested
         if apply_acl and user_principals:
@@ -706,10 +992,6 @@ class NaturalLanguageParser:
         size = parsed.limit if include_pagination and parsed.limit else 20
         from_ = 0  # Can be extended to support offset
 
-        sort = None
-        if include_sort and parsed.order_by:
-            sort = [{parsed.order_by: {"order": parsed.order_direction or "ASC"}}]
-
         request = es_builder.build_search_request(
             query=es_query,
             size=size,
@@ -728,30 +1010,36 @@ class NaturalLanguageParser:
         return request
 
     def build_elasticsearch_query(
-        self, parsed: ParsedQuery, index: str = "repository"
+        self, parsed: ParsedQuery, index: str = "repository", scored: bool = True
     ) -> Dict[str, Any]:
-        """Build Elasticsearch query from parsed natural language."""
-        from .es_query_builder import ElasticsearchQueryBuilder
+        """Build Elasticsearch query from parsed natural language.
+
+        Exact matches always go in filter context, where Elasticsearch caches
+        them. Text matches go in query context so they rank the results,
+        unless ``scored`` is False (e.g. results sorted by a field), in which
+        case they are filters too.
+        """
+        # "Document" means all types, so it adds no type clause
+        typed = bool(parsed.doc_type) and parsed.doc_type != "Document"
+        if not typed and not parsed.conditions:
+            # No conditions - match all, without building any clause list
+            return {"match_all": {}}
+
+        es_builder = _ES_BUILDER
+        must_clauses: List[Dict[str, Any]] = []
+        filter_clauses: List[Dict[str, Any]] = []
+        # Clauses that only contribute relevance go with the filters when
+        # nothing reads the scores
+        text_clauses = must_clauses if scored else filter_clauses
 
-        es_builder = ElasticsearchQueryBuilder()
-        must_clauses = []
-        filter_clauses = []
+        # Term, match and range clauses are plain dict literals in this loop;
+        # the builder is kept for the clauses it composes (fulltext, path)
 
         # Handle document type
-        if parsed.doc_type and parsed.doc_type != "Document":
+        if typed:
             # Map common types to Nuxeo types (but NOT "Document" which means all types)
-            type_mapping = {
-                "pdf": "File",
-                "image": "Picture",
-                "picture": "Picture",
-                "video": "Video",
-                "file": "File",
-                "folder": "Folder",
-                "workspace": "Workspace",
-                "note": "Note",
-            }
-            nuxeo_type = type_mapping.get(parsed.doc_type.lower(), parsed.doc_type)
-            must_clauses.append(es_builder.term("ecm:primaryType", nuxeo_type))
+            nuxeo_type = _NUXEO_TYPES.get(parsed.doc_type.lower(), parsed.doc_type)
+            filter_clauses.append({"term": {"ecm:primaryType": nuxeo_type}})
 
         # Handle conditions
         for condition in parsed.conditions:
@@ -765,138 +1053,56 @@ class NaturalLanguageParser:
                 value = value.strip("'").strip('"')
 
             # Map to appropriate Elasticsearch query
-            if field in ["dc:created", "dc:modified"]:
+            if field in _TIME_FIELDS:
                 # Time-based queries - convert NXQL time formats to ES date math
-                # Handle DATE format strings (check original value before cleaning)
-                if "DATE '" in original_value:
-                    # Handle special DATE values
-                    if "DATE 'TODAY'" in original_value:
-                        if operator == ">=":
-                            filter_clauses.append(es_builder.range(field, gte="now/d"))
-                        elif operator == "<":
-                            filter_clauses.append(es_builder.range(field, lt="now/d"))
-                        elif operator == "<=":
-                            filter_clauses.append(es_builder.range(field, lte="now/d"))
-                        else:
-                            filter_clauses.append(es_builder.range(field, gte="now/d"))
-                        continue
-                    # Extract the date from DATE 'YYYY-MM-DD' format
-                    import re
-                    date_match = re.search(r"DATE '(\d{4}-\d{2}-\d{2})'", original_value)
-                    if date_match:
-                        date_str = date_match.group(1)
-                        if operator == ">=":
-                            filter_clauses.append(es_builder.range(field, gte=date_str))
-                        elif operator == "<":
-                            filter_clauses.append(es_builder.range(field, lt=date_str))
-                        elif operator == "<=":
-                            filter_clauses.append(es_builder.range(field, lte=date_str))
-                        else:
-                            filter_clauses.append(es_builder.range(field, gte=date_str))
-                    continue
-                elif "NOW('-P" in value:
-                    # Extract the period from NOW('-PxD') format
-                    import re
-
-                    period_match = re.search(r"NOW\('-P(\d+)([DWMY])", value)
-                    if period_match:
-                        amount = period_match.group(1)
-                        unit = period_match.group(2).lower()
-                        filter_clauses.append(
-                            es_builder.range(field, gte=f"now-{amount}{unit}")
-                        )
-                elif operator == ">=":
-                    filter_clauses.append(es_builder.range(field, gte=value))
-                elif operator == "<=":
-                    filter_clauses.append(es_builder.range(field, lte=value))
-                elif operator == ">":
-                    filter_clauses.append(es_builder.range(field, gt=value))
-                elif operator == "<":
-                    filter_clauses.append(es_builder.range(field, lt=value))
-                elif operator == "BETWEEN":
-                    # Handle BETWEEN for NXQL format
-                    if " AND " in value:
-                        parts = value.split(" AND ")
-                        if len(parts) == 2:
-                            # First try to extract dates from DATE 'YYYY-MM-DD' format
-                            import re
-                            start_match = re.search(r"DATE '(\d{4}-\d{2}-\d{2})'", parts[0])
-                            end_match = re.search(r"DATE '(\d{4}-\d{2}-\d{2})'", parts[1])
-                            
-                            if start_match and end_match:
-                                start = start_match.group(1)
-                                end = end_match.group(1)
-                            else:
-                                # Fallback to old logic for NOW() format
-                                start = (
-                                    parts[0]
-                                    .replace("DATE '", "")
-                                    .replace("'", "")
-                                    .replace("NOW('-P", "now-")
-                                    .replace("')", "")
-                                )
-                                end = (
-                                    parts[1]
-                                    .replace("DATE '", "")
-                                    .replace("'", "")
-                                    .replace("NOW('-P", "now-")
-                                    .replace("')", "")
-                                )
-                            # Convert TODAY-1 format to now-1d
-                            if "TODAY-" in start:
-                                days = start.replace("TODAY-", "")
-                                start = f"now-{days}d/d"
-                            elif "TODAY" in start:
-                                start = "now/d"
-                            if "TODAY-" in end:
-                                days = end.replace("TODAY-", "")
-                                end = f"now-{days}d/d"
-                            elif "TODAY" in end:
-                                end = "now/d"
-                            filter_clauses.append(
-                                es_builder.range(field, gte=start, lte=end)
-                            )
-                    elif isinstance(value, (list, tuple)) and len(value) == 2:
-                        filter_clauses.append(
-                            es_builder.range(field, gte=value[0], lte=value[1])
-                        )
-            elif field in ["dc:creator", "dc:contributors", "dc:lastContributor"]:
+                if isinstance(original_value, str):
+                    bounds = _time_range_bounds(operator, original_value)
+                elif operator in _RANGE_OPERATORS:
+                    bounds = {_RANGE_OPERATORS[operator]: value}
+                elif (
+                    operator == "BETWEEN"
+                    and isinstance(value, (list, tuple))
+                    and len(value) == 2
+                ):
+                    bounds = {"gte": value[0], "lte": value[1]}
+                else:
+                    bounds = None
+                if bounds:
+                    filter_clauses.append({"range": {field: dict(bounds)}})
+            elif field in _USER_FIELDS:
                 # User queries
                 if index == "audit":
                     # For audit index, use principalName
-                    filter_clauses.append(es_builder.term("principalName", value))
+                    filter_clauses.append({"term": {"principalName": value}})
                 else:
-                    filter_clauses.append(es_builder.term(field, value))
+                    filter_clauses.append({"term": {field: value}})
             elif field == "dc:title":
                 # Title queries - use match for better text matching
                 if operator == "LIKE":
-                    must_clauses.append(es_builder.match(field, value))
+                    text_clauses.append({"match": {field: value}})
                 else:
-                    filter_clauses.append(es_builder.term(field, value))
+                    filter_clauses.append({"term": {field: value}})
             elif field == "ecm:fulltext":
                 # Fulltext search
-                must_clauses.append(es_builder.fulltext_query(value))
+                text_clauses.append(es_builder.fulltext_query(value))
             elif field == "ecm:path":
                 # Path queries
                 if operator == "STARTSWITH":
                     filter_clauses.append(es_builder.path_query(value))
                 else:
-                    filter_clauses.append(es_builder.term(field, value))
-            elif field == "ecm:currentLifeCycleState":
-                # State queries
-                filter_clauses.append(es_builder.term(field, value))
-            elif field == "ecm:isTrashed":
-                # Trash status
-                filter_clauses.append(es_builder.term(field, value))
+                    filter_clauses.append({"term": {field: value}})
+            elif field in _TERM_FIELDS:
+                # Lifecycle state and trash status
+                filter_clauses.append({"term": {field: value}})
             elif field == "ecm:isVersion":
                 # Version status
-                filter_clauses.append(es_builder.term(field, value == "true"))
+                filter_clauses.append({"term": {field: value == "true"}})
             else:
                 # Generic field handling
                 if operator in ["=", "=="]:
-                    filter_clauses.append(es_builder.term(field, value))
+                    filter_clauses.append({"term": {field: value}})
                 elif operator == "LIKE":
-                    must_clauses.append(es_builder.match(field, value))
+                    text_clauses.append({"match": {field: value}})
 
         # Handle audit-specific fields
         if index == "audit":
@@ -922,8 +1128,9 @@ class NaturalLanguageParser:
             else:
                 return es_builder.bool_query(must=must_clauses)
         elif filter_clauses and not must_clauses:
-            # Only filter clauses
-            if len(filter_clauses) == 1:
+            # Only filter clauses; a lone clause stays in filter context
+            # when scores are unused, so Elasticsearch can cache it
+            if len(filter_clauses) == 1 and scored:
                 return filter_clauses[0]
             else:
                 return es_builder.bool_query(filter=filter_clauses)
@@ -932,41 +1139,48 @@ class NaturalLanguageParser:
             return es_builder.bool_query(must=must_clauses, filter=filter_clauses)
 
 
+# Condition for each state keyword, in the same priority order. They are
+# shared by every parse result and must not be modified.
+_STATE_CONDITIONS = {
+    keyword: (
+        {"field": "ecm:isTrashed", "operator": "=", "value": "1"}
+        if state == "deleted"
+        else {"field": "ecm:currentLifeCycleState", "operator": "=", "value": f"'{state}'"}
+    )
+    for keyword, state in NaturalLanguageParser.state_mappings.items()
+}
+
+# Parsing depends only on the query string, so one parser backs the cache
+_SHARED_PARSER = NaturalLanguageParser()
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(query: str) -> ParsedQuery:
+    """Parse a query with the shared parser, memoized per query string."""
+    return _SHARED_PARSER._parse_impl(query)
+
+
 class NXQLBuilder:
     """Builds NXQL queries from parsed components"""
 
-    def __init__(self, parsed_query: ParsedQuery):
+    def __init__(self, parsed_query: ParsedQuery) -> None:
         self.parsed = parsed_query
 
     def build(self) -> str:
         """Build the NXQL query string"""
-        # Build SELECT clause (MongoDB doesn't support aggregates)
-        select_clause = "*"
-
-        # Build FROM clause
-        from_clause = self.parsed.doc_type
-
-        # Build WHERE clause
-        where_clauses = []
-        for condition in self.parsed.conditions:
-            if condition["operator"] == "BETWEEN":
-                where_clauses.append(
-                    f"{condition['field']} {condition['operator']} {condition['value']}"
-                )
-            else:
-                where_clauses.append(
-                    f"{condition['field']} {condition['operator']} {condition['value']}"
-                )
-
-        # Construct the query
-        query_parts = [f"SELECT {select_clause}", f"FROM {from_clause}"]
+        # SELECT * only, since MongoDB doesn't support aggregates
+        query = f"SELECT * FROM {self.parsed.doc_type}"
 
-        if where_clauses:
-            query_parts.append(f"WHERE {' AND '.join(where_clauses)}")
+        if self.parsed.conditions:
+            where = " AND ".join(
+                f"{condition['field']} {condition['operator']} {condition['value']}"
+                for condition in self.parsed.conditions
+            )
+            query = f"{query} WHERE {where}"
 
         # Add ORDER BY clause
         if self.parsed.order_by:
             direction = self.parsed.order_direction or "ASC"
-            query_parts.append(f"ORDER BY {self.parsed.order_by} {direction}")
+            query = f"{query} ORDER BY {self.parsed.order_by} {direction}"
 
-        return " ".join(query_parts)
+        return query
@@ -7,15 +7,43 @@ This module defines the resources for the Nuxeo MCP Server.
 
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional, Callable
+from urllib.parse import quote
 from nuxeo_mcp.utility import format_doc, return_blob
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger("nuxeo_mcp.resources")
 
 # Type aliases
 ResourceFunction = Callable[[], Dict[str, Any]]
 
+# Location of the NXQL guide served by the nuxeo://nxql-guide resource
+_NXQL_GUIDE_PATH = os.path.join(os.path.dirname(__file__), "../../specs/19_nxql_guide.md")
+
+
+@lru_cache(maxsize=1)
+def _load_nxql_guide() -> Optional[str]:
+    """
+    Read the NXQL guide once and keep it in memory.
+
+    The guide ships with the server and does not change while it runs; call
+    ``_load_nxql_guide.cache_clear()`` to force a re-read.
+
+    Returns:
+        The guide content, or None if the file does not exist
+    """
+    if not os.path.exists(_NXQL_GUIDE_PATH):
+        return None
+    with open(_NXQL_GUIDE_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
 
 def register_resources(mcp, nuxeo) -> None:
     """
@@ -58,6 +86,27 @@ def register_resources(mcp, nuxeo) -> None:
             logger.error(f"Error getting Nuxeo info: {e}")
             return {"error": str(e)}
 
+    def get_document_json(ref: str, is_path: bool = False) -> Dict[str, Any]:
+        """
+        Fetch the JSON of a document straight from the REST API.
+
+        This skips building a Document model that would only be turned back
+        into a dict for formatting.
+
+        Args:
+            ref: The document UID, or its path if is_path is True
+            is_path: Whether ref is a path
+
+        Returns:
+            The document JSON as a dictionary
+        """
+        endpoint = f"api/v1/path{quote(ref)}" if is_path else f"api/v1/id/{ref}"
+        response = nuxeo.client.request("GET", endpoint)
+        # Decode with orjson when installed, property maps can be large
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+
     @mcp.resource(
         uri="nuxeo://{uid}",
         name="Get  Document using UUID",
@@ -65,7 +114,7 @@ def register_resources(mcp, nuxeo) -> None:
     )
     def get_document(uid: str) -> Dict[str, Any]:
 
-        return format_doc(nuxeo.documents.get(uid=uid).as_dict())
+        return format_doc(get_document_json(uid))
 
     @mcp.resource(
         uri="nuxeo://{path*}",
@@ -77,21 +126,17 @@ def register_resources(mcp, nuxeo) -> None:
         if not path.startswith("/"):
             path = f"/{path}"
 
-        if "@" in path:
-            parts = path.split("@")
-            path = parts[0]
-            adapter_path = parts[1]
-            parts = adapter_path.split("/")
-            adapter = parts[0]
-            adapter_param = None
-            if len(parts) > 1:
-                adapter_param = adapter_path[len[adapter] :]
-
-            return get_document_with_dapater(
-                uid, adapter=adapter, adapter_param=adapter_param
+        # A single scan splits "<path>@<adapter>[/<param>]"
+        path, has_adapter, adapter_path = path.partition("@")
+        if has_adapter:
+            adapter, _, adapter_param = adapter_path.partition("/")
+            return call_adapter(
+                f"api/v1/repo/default/path{quote(path)}",
+                adapter=adapter,
+                adapter_param=adapter_param or None,
             )
 
-        return format_doc(nuxeo.documents.get(path=path).as_dict())
+        return format_doc(get_document_json(path, is_path=True))
 
     @mcp.resource(
         uri="nuxeo://{uid}@{adapter}/{adapter_param}",
@@ -102,30 +147,49 @@ def register_resources(mcp, nuxeo) -> None:
         uid: str, adapter: str, adapter_param: str | None
     ) -> Dict[str, Any]:
 
-        uid = uid.trim()
+        uid = uid.strip()
+        return call_adapter(
+            f"api/v1/repo/default/id/{uid}", adapter=adapter, adapter_param=adapter_param
+        )
+
+    def call_adapter(
+        doc_uri: str, adapter: str, adapter_param: str | None
+    ) -> Dict[str, Any]:
+        """
+        Call a REST API adapter on a document.
 
-        uri: str = f"api/v1/repo/default/id/{uid}/@{adapter}"
+        Args:
+            doc_uri: The API URI of the document, by id or by path
+            adapter: The adapter name
+            adapter_param: Optional parameter appended to the adapter URI
+
+        Returns:
+            The blob returned by the adapter, or the raw response content
+        """
+        uri: str = f"{doc_uri}/@{adapter}"
         if adapter_param:
             uri = f"{uri}/{adapter_param}"
 
-        print(f"CALLING adapter api on {uri}")
-        r = nuxeo.client.request("GET", uri)
-
-        disposition = r.headers.get("content-disposition", None)
-        if disposition:
-            filename = disposition.split(";")[-1].split("=")[-1]
-            content_length = int(r.headers["content-length"])
-            mime = r.headers["content-type"]
-            blob_info = {
-                "name": filename,
-                "mime_type": mime,
-                "size": content_length,
-                "content": r.content,
-            }
-            return return_blob(blob_info)
+        logger.debug(f"Calling adapter API on {uri}")
+        # Stream the response so the headers are read before the body
+        with nuxeo.client.request("GET", uri, stream=True) as r:
+            disposition = r.headers.get("content-disposition", None)
+            if disposition:
+                filename = disposition.split(";")[-1].split("=")[-1]
+                mime = r.headers["content-type"]
+                # Read the body in one piece rather than joining downloaded
+                # chunks, so a single copy of the blob is held in memory
+                content = r.raw.read(decode_content=True)
+                blob_info = {
+                    "name": filename,
+                    "mime_type": mime,
+                    "size": int(r.headers.get("content-length", len(content))),
+                    "content": content,
+                }
+                return return_blob(blob_info)
 
-        else:
-            return r.content
+            else:
+                return r.content
 
     # Resource: NXQL Guide Documentation
     @mcp.resource(
@@ -141,14 +205,9 @@ def register_resources(mcp, nuxeo) -> None:
             The NXQL guide content or error message
         """
         try:
-            # Get the path to the NXQL guide file
-            guide_path = os.path.join(os.path.dirname(__file__), "../../specs/19_nxql_guide.md")
-
-            # Read the guide content
-            if os.path.exists(guide_path):
-                with open(guide_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
+            # Read the guide content (cached after the first read)
+            content = _load_nxql_guide()
+            if content is not None:
                 return {
                     "content": content,
                     "format": "markdown",
@@ -156,7 +215,7 @@ def register_resources(mcp, nuxeo) -> None:
                     "description": "Complete reference for NXQL syntax, operators, properties, and MongoDB limitations",
                 }
             else:
-                return {"error": "NXQL guide file not found", "path": guide_path}
+                return {"error": "NXQL guide file not found", "path": _NXQL_GUIDE_PATH}
         except Exception as e:
             logger.error(f"Error reading NXQL guide: {e}")
             return {"error": str(e)}
@@ -1,7 +1,50 @@
 """Elasticsearch Search Request Filters for security."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional
+
+
+def _add_filter_clauses(
+    query: Dict[str, Any], clauses: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Add filter clauses to a query without modifying it.
+
+    Args:
+        query: The Elasticsearch query to filter
+        clauses: The filter clauses to add
+
+    Returns:
+        The query itself if there is nothing to add, otherwise a bool query
+        with the clauses appended to its filter
+    """
+    if not clauses:
+        return query
+    if "bool" in query:
+        bool_query = query["bool"]
+        if "filter" not in bool_query:
+            filters = clauses
+        elif isinstance(bool_query["filter"], list):
+            filters = bool_query["filter"] + clauses
+        else:
+            filters = [bool_query["filter"], *clauses]
+        return {"bool": {**bool_query, "filter": filters}}
+    # Wrap query in bool with filter
+    return {"bool": {"must": [query], "filter": clauses}}
+
+
+@lru_cache(maxsize=None)
+def _clauses_cover_apply(filter_type: type) -> bool:
+    """Tell whether a filter class's ``filter_clauses`` stands for its ``apply``.
+
+    A subclass that overrides ``apply`` without also overriding
+    ``filter_clauses`` inherits clauses that miss its own restrictions, so
+    the chain must call its ``apply`` instead.
+    """
+    mro = filter_type.__mro__
+    apply_owner = next(c for c in mro if "apply" in vars(c))
+    clauses_owner = next(c for c in mro if "filter_clauses" in vars(c))
+    return mro.index(apply_owner) >= mro.index(clauses_owner)
 
 
 class SearchRequestFilter(ABC):
@@ -26,6 +69,28 @@ class SearchRequestFilter(ABC):
         """
         pass
 
+    def filter_clauses(
+        self, principal: str, groups: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get the filter clauses this filter adds to every query.
+
+        Filters whose ``apply`` only appends filter clauses can return them
+        here, so a FilterChain wraps the query once for all of them. The
+        chain ignores this method for subclasses that override ``apply``
+        without overriding it as well.
+
+        Args:
+            principal: The user principal making the request
+            groups: List of groups the user belongs to
+
+        Returns:
+            The clauses to add, or None if the filter must go through ``apply``
+
+        Raises:
+            PermissionError: If the user is not allowed to perform the query
+        """
+        return None
+
     @abstractmethod
     def get_index_name(self) -> str:
         """Get the target Elasticsearch index name."""
@@ -44,6 +109,14 @@ class DefaultSearchRequestFilter(SearchRequestFilter):
         self, query: Dict[str, Any], principal: str, groups: List[str]
     ) -> Dict[str, Any]:
         """Apply ACL security filter to repository queries."""
+        # The query is rebuilt around the added clause; the caller's dict
+        # is never modified
+        return _add_filter_clauses(query, self.filter_clauses(principal, groups))
+
+    def filter_clauses(
+        self, principal: str, groups: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Get the ACL filter matching the user principal and groups."""
         if not self.validate_principal(principal):
             raise PermissionError(
                 f"Principal {principal} is not allowed to query repository"
@@ -51,27 +124,7 @@ class DefaultSearchRequestFilter(SearchRequestFilter):
 
         # Build ACL filter with user principal and groups
         principals = [principal] + groups
-        acl_filter = {"terms": {"ecm:acl": principals}}
-
-        # Apply filter to query
-        if "bool" in query:
-            # Query is already a bool query
-            bool_query = query["bool"].copy()
-
-            # Add to existing filter clause
-            if "filter" in bool_query:
-                if isinstance(bool_query["filter"], list):
-                    bool_query["filter"] = bool_query["filter"].copy()
-                    bool_query["filter"].append(acl_filter)
-                else:
-                    bool_query["filter"] = [bool_query["filter"], acl_filter]
-            else:
-                bool_query["filter"] = [acl_filter]
-
-            return {"bool": bool_query}
-        else:
-            # Wrap query in bool with filter
-            return {"bool": {"must": [query], "filter": [acl_filter]}}
+        return [{"terms": {"ecm:acl": principals}}]
 
     def get_index_name(self) -> str:
         """Get the repository index name."""
@@ -85,19 +138,30 @@ class DefaultSearchRequestFilter(SearchRequestFilter):
 class AuditRequestFilter(SearchRequestFilter):
     """Filter for audit index - admin only access."""
 
+    # Principals and groups granted access to the audit index
+    ADMIN_PRINCIPALS = frozenset({"Administrator"})
+    ADMIN_GROUPS = frozenset({"Administrators"})
+
     def apply(
         self, query: Dict[str, Any], principal: str, groups: List[str]
     ) -> Dict[str, Any]:
         """Apply admin-only filter to audit queries."""
+        self.filter_clauses(principal, groups)
+
+        # Admins can see all audit entries, return query as-is
+        return query
+
+    def filter_clauses(
+        self, principal: str, groups: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Check admin access; admins need no extra filter."""
         # Check if user is administrator
         if not self._is_admin(principal, groups):
             raise PermissionError(
                 f"Principal {principal} is not allowed to query audit index. "
                 "Only administrators can access audit logs."
             )
-
-        # Admins can see all audit entries, return query as-is
-        return query
+        return []
 
     def get_index_name(self) -> str:
         """Get the audit index name."""
@@ -105,11 +169,17 @@ class AuditRequestFilter(SearchRequestFilter):
 
     def validate_principal(self, principal: str) -> bool:
         """Validate principal - only Administrator."""
-        return principal == "Administrator"
+        return principal in self.ADMIN_PRINCIPALS
+
+    def _is_admin(self, principal: str, groups: Iterable[str]) -> bool:
+        """Check if user is an administrator.
 
-    def _is_admin(self, principal: str, groups: List[str]) -> bool:
-        """Check if user is an administrator."""
-        return principal == "Administrator" or "Administrators" in groups
+        Membership is tested against the admin sets, so groups can be any
+        iterable and the check stops at the first admin group found.
+        """
+        return principal in self.ADMIN_PRINCIPALS or not self.ADMIN_GROUPS.isdisjoint(
+            groups
+        )
 
 
 class FilterChain:
@@ -128,6 +198,11 @@ class FilterChain:
     ) -> Dict[str, Any]:
         """Apply all filters in sequence.
 
+        Clauses of consecutive filters that provide ``filter_clauses`` are
+        collected and added to the query in a single step, instead of each
+        filter rebuilding the bool query in turn. Filters whose ``apply`` is
+        overridden below their ``filter_clauses`` are applied as usual.
+
         Args:
             query: The Elasticsearch query to filter
             principal: The user principal making the request
@@ -137,9 +212,19 @@ class FilterChain:
             The filtered query with all security constraints applied
         """
         result = query
+        pending: List[Dict[str, Any]] = []
         for filter_instance in self.filters:
-            result = filter_instance.apply(result, principal, groups)
-        return result
+            clauses = None
+            if _clauses_cover_apply(type(filter_instance)):
+                clauses = filter_instance.filter_clauses(principal, groups)
+            if clauses is None:
+                # Add what was collected so far, then let the filter apply itself
+                result = _add_filter_clauses(result, pending)
+                pending = []
+                result = filter_instance.apply(result, principal, groups)
+            else:
+                pending.extend(clauses)
+        return _add_filter_clauses(result, pending)
 
     def validate_principal(self, principal: str) -> bool:
         """Validate principal through all filters."""
@@ -165,24 +250,16 @@ class WorkflowAuditRequestFilter(SearchRequestFilter):
         This would filter audit events to only show workflow events
         for workflows the user has permission to view.
         """
-        # First check admin access
-        filtered_query = self.base_filter.apply(query, principal, groups)
-
-        # Add workflow-specific filtering
+        # Check admin access and add the workflow-specific filter
+        return _add_filter_clauses(query, self.filter_clauses(principal, groups))
+
+    def filter_clauses(
+        self, principal: str, groups: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Check admin access and get the workflow event filter."""
+        self.base_filter.filter_clauses(principal, groups)
         # In a real implementation, this would check workflow permissions
-        workflow_filter = {"term": {"category": "eventWorkflowCategory"}}
-
-        if "bool" in filtered_query:
-            if "filter" in filtered_query["bool"]:
-                filtered_query["bool"]["filter"].append(workflow_filter)
-            else:
-                filtered_query["bool"]["filter"] = [workflow_filter]
-        else:
-            filtered_query = {
-                "bool": {"must": [filtered_query], "filter": [workflow_filter]}
-            }
-
-        return filtered_query
+        return [{"term": {"category": "eventWorkflowCategory"}}]
 
     def get_index_name(self) -> str:
         """Get the audit workflow view name."""
@@ -1042,6 +1042,30 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
 
             return result
 
+    # Elasticsearch passthrough shared by the search tools, so its pooled
+    # keep-alive connections are reused across calls. It is rebuilt, and the
+    # old one closed, when the server or its credentials change.
+    es_passthrough = None
+
+    def get_es_passthrough():
+        """Get the shared Elasticsearch passthrough for the current server."""
+        nonlocal es_passthrough
+        # Import here to avoid circular dependency
+        from .es_passthrough import ElasticsearchPassthrough
+
+        # Get the Nuxeo URL and auth from the global nuxeo client
+        nuxeo_url = nuxeo.client.host
+        auth = nuxeo.client.auth
+        if (
+            es_passthrough is None
+            or es_passthrough.nuxeo_url != nuxeo_url
+            or es_passthrough.auth is not auth
+        ):
+            if es_passthrough is not None:
+                es_passthrough.close()
+            es_passthrough = ElasticsearchPassthrough(nuxeo_url=nuxeo_url, auth=auth)
+        return es_passthrough
+
     @mcp.tool()
     async def search_repository(query: str, limit: int = 20, offset: int = 0) -> str:
         """
@@ -1068,8 +1092,6 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
             - "images from last month"
         """
         try:
-            # Import here to avoid circular dependency
-            from .es_passthrough import ElasticsearchPassthrough
             import requests
 
             # Get current user context (in real implementation, this would come from auth)
@@ -1081,25 +1103,12 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
             if limit > 100:
                 limit = 100
 
-            # Initialize passthrough with Nuxeo URL and auth
-            # Get the Nuxeo URL and auth from the global nuxeo client
-            nuxeo_url = nuxeo.client.host
-            auth = nuxeo.client.auth
-            
-            passthrough = ElasticsearchPassthrough(nuxeo_url=nuxeo_url, auth=auth)
+            passthrough = get_es_passthrough()
             
-            # Check if Elasticsearch is accessible through Nuxeo passthrough
+            # Check if Elasticsearch is accessible through Nuxeo passthrough,
+            # off the event loop and over the shared session
             try:
-                # Test with a simple match_all query
-                test_url = f"{passthrough.base_url}/nuxeo/_search"
-                test_query = {"query": {"match_all": {}}, "size": 0}
-                response = requests.post(
-                    test_url, 
-                    json=test_query,
-                    auth=auth,
-                    timeout=2
-                )
-                response.raise_for_status()
+                await passthrough.check_available_async("nuxeo")
             except (requests.RequestException, requests.ConnectionError) as e:
                 logger.warning(f"Elasticsearch not accessible at {passthrough.base_url}: {e}")
                 return json.dumps({
@@ -1110,7 +1119,7 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
                 })
 
             # Execute search
-            results = passthrough.search_repository(
+            results = await passthrough.search_repository_async(
                 query=query,
                 principal=principal,
                 groups=groups,
@@ -1164,8 +1173,6 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
             - "failed login attempts today"
         """
         try:
-            # Import here to avoid circular dependency
-            from .es_passthrough import ElasticsearchPassthrough
             import requests
 
             # For audit, must be administrator
@@ -1176,25 +1183,12 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
             if limit > 100:
                 limit = 100
 
-            # Initialize passthrough with Nuxeo URL and auth
-            # Get the Nuxeo URL and auth from the global nuxeo client
-            nuxeo_url = nuxeo.client.host
-            auth = nuxeo.client.auth
-            
-            passthrough = ElasticsearchPassthrough(nuxeo_url=nuxeo_url, auth=auth)
+            passthrough = get_es_passthrough()
             
-            # Check if Elasticsearch is accessible through Nuxeo passthrough
+            # Check if Elasticsearch is accessible through Nuxeo passthrough,
+            # off the event loop and over the shared session
             try:
-                # Test with a simple match_all query on audit index
-                test_url = f"{passthrough.base_url}/audit/_search"
-                test_query = {"query": {"match_all": {}}, "size": 0}
-                response = requests.post(
-                    test_url, 
-                    json=test_query,
-                    auth=auth,
-                    timeout=2
-                )
-                response.raise_for_status()
+                await passthrough.check_available_async("audit")
             except (requests.RequestException, requests.ConnectionError) as e:
                 logger.warning(f"Elasticsearch audit index not accessible at {passthrough.base_url}: {e}")
                 return json.dumps({
@@ -1205,7 +1199,7 @@ def register_tools(mcp, nuxeo, auth_middleware=None) -> None:
                 })
 
             # Execute search
-            results = passthrough.search_audit(
+            results = await passthrough.search_audit_async(
                 query=query,
                 principal=principal,
                 groups=groups,
@@ -16,7 +16,7 @@ from nuxeo_mcp.config import (
     MCPAuthConfig,
 )
 from nuxeo_mcp.token_store import OAuth2Token, EncryptedFileStorage, TokenManager
-from nuxeo_mcp.auth import BasicAuthHandler, OAuth2AuthHandler
+from nuxeo_mcp.auth import BasicAuthHandler, OAuth2AuthHandler, _Flow
 from nuxeo_mcp.middleware import AuthMiddleware, AuthenticationManager
 
 
@@ -350,6 +350,65 @@ class TestBasicAuthHandler:
         assert result is False
 
 
+class TestOAuth2FlowDispatch:
+    """Test dispatching OAuth2 callbacks to pending flows."""
+    
+    def setup_method(self):
+        """Set up a handler with two pending flows sharing a callback server."""
+        config = NuxeoServerConfig(
+            url="http://test.com",
+            auth_method=AuthMethod.OAUTH2,
+            oauth2_config=OAuth2Config(client_id="test-client", client_secret="test-secret"),
+        )
+        self.handler = OAuth2AuthHandler(config, token_manager=MagicMock())
+        self.callback_server = MagicMock()
+        self.handler._callback_server = self.callback_server
+        self.handler._callback_port = 8888
+        self.flow_a = _Flow("verifier-a", "http://localhost:8888/callback", MagicMock())
+        self.flow_b = _Flow("verifier-b", "http://localhost:8888/callback", MagicMock())
+        self.handler._flows = {"state-a": self.flow_a, "state-b": self.flow_b}
+    
+    def test_matching_state_completes_only_its_flow(self):
+        """Test a callback completes the flow with the same state only."""
+        self.handler._complete_flow("state-a", auth_code="code-a")
+        
+        assert self.flow_a.event.is_set()
+        assert self.flow_a.auth_code == "code-a"
+        assert not self.flow_b.event.is_set()
+        assert self.flow_b.auth_code is None
+    
+    def test_unknown_state_is_ignored(self):
+        """Test a callback with an unknown state completes no flow."""
+        self.handler._complete_flow("state-x", auth_code="code-x")
+        self.handler._complete_flow(None, auth_code="code-x")
+        
+        assert not self.flow_a.event.is_set()
+        assert not self.flow_b.event.is_set()
+    
+    def test_error_without_state_fails_every_flow(self):
+        """Test an error that cannot be matched to a flow fails all of them."""
+        self.handler._complete_flow(None, auth_error="access_denied")
+        
+        for flow in (self.flow_a, self.flow_b):
+            assert flow.event.is_set()
+            assert flow.auth_code is None
+            assert flow.auth_error == "access_denied"
+    
+    def test_callback_server_stops_after_last_flow(self):
+        """Test the shared callback server stops once no flow is pending."""
+        self.handler._release_flow("state-a")
+        
+        self.callback_server.shutdown.assert_not_called()
+        assert self.handler._callback_server is self.callback_server
+        
+        self.handler._release_flow("state-b")
+        
+        self.callback_server.shutdown.assert_called_once_with()
+        self.callback_server.server_close.assert_called_once_with()
+        assert self.handler._callback_server is None
+        assert self.handler._callback_port is None
+
+
 class TestAuthMiddleware:
     """Test authentication middleware."""
     
@@ -377,7 +436,7 @@ class TestAuthMiddleware:
         middleware.logout()
         
         assert middleware._authenticated is False
-        assert middleware._last_auth_check is None
+        assert middleware._auth_expiry is None
         mock_handler.logout.assert_called_once()
 
 
@@ -24,6 +24,12 @@ class TestElasticsearchPassthrough:
         assert self.passthrough.filters is not None
         assert self.passthrough.auth == self.auth
     
+    def test_close_closes_session(self):
+        """Test that close releases the pooled HTTP session."""
+        with patch.object(self.passthrough._session, "close") as mock_close:
+            self.passthrough.close()
+        mock_close.assert_called_once_with()
+
     def test_initialization_with_embedded_es(self):
         """Test initialization without nuxeo_url (uses environment or default)."""
         # When no nuxeo_url is provided, it uses environment variable or default
@@ -33,7 +39,7 @@ class TestElasticsearchPassthrough:
         assert passthrough.base_url == default_url
         assert passthrough.auth is None
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_search_repository_with_nl_query(self, mock_post):
         """Test searching repository with natural language query."""
         # Mock ES response
@@ -52,6 +58,7 @@ class TestElasticsearchPassthrough:
                 }]
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         result = self.passthrough.search_repository(
@@ -73,7 +80,7 @@ class TestElasticsearchPassthrough:
         # Should have ACL filter applied
         assert "bool" in request_body["query"]
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_search_audit_admin_only(self, mock_post):
         """Test audit search requires admin privileges."""
         # Non-admin should be rejected
@@ -93,6 +100,7 @@ class TestElasticsearchPassthrough:
                 "hits": []
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         result = self.passthrough.search_audit(
@@ -104,7 +112,7 @@ class TestElasticsearchPassthrough:
         assert result is not None
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_search_with_pagination(self, mock_post):
         """Test search with pagination parameters."""
         mock_response = Mock()
@@ -115,6 +123,7 @@ class TestElasticsearchPassthrough:
                 "hits": []
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         result = self.passthrough.search_repository(
@@ -130,13 +139,37 @@ class TestElasticsearchPassthrough:
         request_body = json.loads(call_args[1]["data"])
         assert request_body["size"] == 10
         assert request_body["from"] == 20
+        # Only the fields used in the formatted results are fetched
+        assert "dc:title" in request_body["_source"]["includes"]
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
+    def test_cached_parse_not_mutated_by_pagination(self, mock_post):
+        """Test repeated queries reuse the parse without leaking pagination."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        self.passthrough.clear_parse_cache()
+        
+        self.passthrough.search_repository(
+            query="all documents", principal="user", groups=["members"], limit=10, offset=20
+        )
+        self.passthrough.search_repository(
+            query="all documents", principal="user", groups=["members"], limit=5
+        )
+        
+        request_body = json.loads(mock_post.call_args[1]["data"])
+        assert request_body["size"] == 5
+        assert request_body.get("from", 0) != 20
+    
+    @patch('requests.Session.post')
     def test_execute_es_query_direct(self, mock_post):
         """Test executing direct Elasticsearch query."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"hits": {"hits": []}}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_post.return_value = mock_response
         
         es_query = {
@@ -159,7 +192,7 @@ class TestElasticsearchPassthrough:
         request_body = json.loads(call_args[1]["data"])
         assert "bool" in request_body["query"]
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_error_handling(self, mock_post):
         """Test error handling for ES failures."""
         # Simulate ES error
@@ -177,7 +210,7 @@ class TestElasticsearchPassthrough:
         
         assert "Elasticsearch error" in str(exc_info.value)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_connection_error_handling(self, mock_post):
         """Test handling of connection errors."""
         mock_post.side_effect = Exception("Connection refused")
@@ -190,6 +223,56 @@ class TestElasticsearchPassthrough:
             )
         
         assert "Connection" in str(exc_info.value)
+
+    @patch('requests.Session.post')
+    def test_check_available_async(self, mock_post):
+        """Test the availability probe goes through the pooled session."""
+        import asyncio
+        import requests
+
+        mock_post.return_value.raise_for_status.return_value = None
+        asyncio.run(self.passthrough.check_available_async("audit"))
+
+        url = mock_post.call_args[0][0]
+        assert url == f"{self.nuxeo_url}/site/es/audit/_search"
+        assert json.loads(mock_post.call_args[1]["data"])["size"] == 0
+
+        mock_post.side_effect = requests.ConnectionError("Connection refused")
+        with pytest.raises(requests.RequestException):
+            asyncio.run(self.passthrough.check_available_async("audit"))
+
+    @patch('requests.Session.post')
+    def test_search_batch_uses_msearch(self, mock_post):
+        """Test batching repository and audit searches into one _msearch call."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "responses": [
+                {"hits": {"total": {"value": 1}, "hits": [{"_source": {"dc:title": "Doc"}}]}},
+                {"error": {"type": "index_not_found_exception"}},
+            ]
+        }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
+        mock_post.return_value = mock_response
+        
+        results = self.passthrough.search_batch(
+            [
+                {"query": "documents created by john"},
+                {"query": "modified documents", "index": "audit"},
+            ],
+            principal="Administrator",
+            groups=["administrators"],
+        )
+        
+        mock_post.assert_called_once()
+        assert mock_post.call_args[0][0].endswith("/_msearch")
+        lines = mock_post.call_args[1]["data"].splitlines()
+        assert json.loads(lines[0]) == {"index": "nuxeo"}
+        assert json.loads(lines[2]) == {"index": "audit"}
+        assert "bool" in json.loads(lines[1])["query"]
+        
+        assert results[0]["results"][0]["title"] == "Doc"
+        assert results[1]["error"]["type"] == "index_not_found_exception"
     
     def test_format_repository_results(self):
         """Test formatting of repository search results."""
@@ -274,7 +357,17 @@ class TestElasticsearchPassthrough:
         assert result["id"] == "audit-1"
         assert result["eventId"] == "documentModified"
         assert result["principalName"] == "alice"
-    
+
+    def test_format_results_with_integer_total(self):
+        """Test formatting of results reporting the pre-7 integer total."""
+        es_response = {"hits": {"total": 3, "hits": []}, "took": 5}
+
+        formatted = self.passthrough._format_repository_results(es_response, "q")
+        assert formatted["total"] == 3
+
+        formatted = self.passthrough._format_audit_results(es_response, "q")
+        assert formatted["total"] == 3
+
     def test_get_filter_for_index(self):
         """Test getting appropriate filter for index."""
         # Repository filter
@@ -221,6 +221,27 @@ class TestElasticsearchQueryBuilder:
         }
         assert filtered_query == expected
 
+    def test_apply_acl_filter_hoists_nested_bool(self):
+        """Test ACL filtering a bool that only wraps another bool stays flat."""
+        inner = self.builder.bool_query(
+            should=[self.builder.match("title", "report"), self.builder.match("title", "memo")]
+        )
+        base_query = self.builder.bool_query(must=[inner])
+
+        filtered_query = self.builder.apply_acl_filter(base_query, ["john.doe"])
+
+        expected = {
+            "bool": {
+                "should": [
+                    {"match": {"title": "report"}},
+                    {"match": {"title": "memo"}},
+                ],
+                "minimum_should_match": 1,
+                "filter": [{"terms": {"ecm:acl": ["john.doe"]}}],
+            }
+        }
+        assert filtered_query == expected
+
     def test_build_search_request(self):
         """Test building complete search request."""
         query = self.builder.match("title", "report")
@@ -57,7 +57,24 @@ class TestNaturalLanguageParser:
             assert time_condition['field'] == expected_field
             assert time_condition['operator'] == expected_op
             assert time_condition['value'] == expected_value
-    
+
+    def test_time_pattern_priority(self):
+        """Test that the first listed time pattern wins, wherever it appears."""
+        result = self.parser.parse("documents modified this month or today")
+        assert result.conditions[0]['value'] == "DATE 'TODAY'"
+
+        result = self.parser.parse("files from last week created today")
+        assert result.conditions[0]['value'] == "DATE 'TODAY'"
+
+        result = self.parser.parse("documents modified this week or last week")
+        assert result.conditions[0]['value'] == "NOW('-P7D')"
+
+        result = self.parser.parse("documents modified last 7 days or this month")
+        assert result.conditions[0]['value'] == "NOW('-P1M')"
+
+        result = self.parser.parse("files from last 3 days this week")
+        assert result.conditions[0]['value'] == "NOW('-P7D')"
+
     def test_user_based_queries(self):
         """Test parsing of user-related queries."""
         test_cases = [
@@ -240,6 +257,16 @@ class TestNaturalLanguageParser:
         )
         assert has_time_condition
 
+    def test_parse_results_are_memoized(self):
+        """Test that repeated queries reuse the cached parse result."""
+        query = "find invoices created by john last week"
+
+        first = self.parser.parse(query)
+        second = NaturalLanguageParser().parse(query)
+
+        assert second is first
+        assert self.parser.parse("find files") is not first
+
 
 class TestNXQLBuilder:
     """Test the NXQLBuilder class."""
@@ -384,4 +411,14 @@ class TestEndToEnd:
         assert parsed.explanation is not None
         assert "invoice" in parsed.explanation.lower()
         assert "creator" in parsed.explanation.lower() or "john" in parsed.explanation.lower()
-        assert "ordered by" in parsed.explanation.lower() or "sorted" in parsed.explanation.lower()
\ No newline at end of file
+        assert "ordered by" in parsed.explanation.lower() or "sorted" in parsed.explanation.lower()
+
+    def test_hand_built_parsed_query_explanation(self):
+        """Test that a hand-built ParsedQuery keeps the explanation it is given."""
+        parsed = ParsedQuery(intent="search", doc_type="File", conditions=[])
+        assert parsed.explanation is None
+
+        parsed = ParsedQuery(
+            intent="search", doc_type="File", conditions=[], explanation="All files"
+        )
+        assert parsed.explanation == "All files"
@@ -213,4 +213,32 @@ class TestNaturalLanguageParserElasticsearch:
         assert result is not None
         assert "_source" in result
         assert "includes" in result["_source"]
-        assert "dc:title" in result["_source"]["includes"]
\ No newline at end of file
+        assert "dc:title" in result["_source"]["includes"]
+
+    def test_build_elasticsearch_query_date_range_operators(self):
+        """Test that date comparisons map to the matching range bounds."""
+        from src.nuxeo_mcp.nl_parser import ParsedQuery
+
+        for operator, bound in ((">=", "gte"), (">", "gt"), ("<", "lt"), ("<=", "lte")):
+            parsed = ParsedQuery(
+                intent="search",
+                doc_type="Document",
+                conditions=[
+                    {"field": "dc:modified", "operator": operator, "value": "DATE '2024-01-15'"}
+                ],
+            )
+            es_query = self.parser.build_elasticsearch_query(parsed)
+
+            assert es_query == {"range": {"dc:modified": {bound: "2024-01-15"}}}
+
+    def test_sorted_query_uses_filter_context(self):
+        """Test that text matches only score results when no sort is applied."""
+        query = "PDFs with title containing \"budget\" order by modified"
+
+        unsorted = self.parser.parse_to_elasticsearch(query)["query"]["bool"]
+        assert {"match": {"dc:title": "%budget%"}} in unsorted["must"]
+        assert {"term": {"ecm:primaryType": "File"}} in unsorted["filter"]
+
+        sorted_query = self.parser.parse_to_elasticsearch(query, include_sort=True)["query"]["bool"]
+        assert "must" not in sorted_query
+        assert {"match": {"dc:title": "%budget%"}} in sorted_query["filter"]
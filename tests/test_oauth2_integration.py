@@ -148,6 +148,11 @@ class TestOAuth2Integration:
                     mock_server.auth_error = None
                     mock_callback.return_value = mock_server
                     
+                    # The browser "redirects back" to the pending flow
+                    mock_browser_open.side_effect = lambda url: handler._complete_flow(
+                        next(iter(handler._flows)), auth_code="test-auth-code"
+                    )
+                    
                     # Mock state validation
                     with patch.object(handler, '_generate_pkce_challenge') as mock_pkce:
                         mock_pkce.return_value = ("verifier", "challenge")
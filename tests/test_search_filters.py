@@ -170,6 +170,55 @@ class TestFilterChain:
         assert result["filter1"] == True
         assert result["filter2"] == True
     
+    def test_chain_adds_filter_clauses_once(self):
+        """Test that filter clauses of several filters are added in one bool."""
+        class TagFilter(SearchRequestFilter):
+            def apply(self, query, principal, groups):
+                raise AssertionError("clauses should be collected instead")
+
+            def filter_clauses(self, principal, groups):
+                return [{"term": {"tag": "public"}}]
+
+            def get_index_name(self):
+                return "test"
+
+            def validate_principal(self, principal):
+                return True
+
+        chain = FilterChain([DefaultSearchRequestFilter(), TagFilter()])
+        query = {"bool": {"must": [{"match": {"title": "report"}}], "filter": []}}
+
+        result = chain.apply(query, "alice", ["staff"])
+
+        assert result == {
+            "bool": {
+                "must": [{"match": {"title": "report"}}],
+                "filter": [
+                    {"terms": {"ecm:acl": ["alice", "staff"]}},
+                    {"term": {"tag": "public"}},
+                ],
+            }
+        }
+        # The caller's query is left untouched
+        assert query["bool"]["filter"] == []
+
+    def test_chain_applies_subclass_overriding_apply(self):
+        """Test that a subclass overriding only apply is not bypassed."""
+        class RestrictedFilter(DefaultSearchRequestFilter):
+            def apply(self, query, principal, groups):
+                query = super().apply(query, principal, groups)
+                query["bool"]["filter"].append({"term": {"confidential": False}})
+                return query
+
+        chain = FilterChain([RestrictedFilter()])
+
+        result = chain.apply({"match_all": {}}, "alice", ["staff"])
+
+        assert result["bool"]["filter"] == [
+            {"terms": {"ecm:acl": ["alice", "staff"]}},
+            {"term": {"confidential": False}},
+        ]
+
     def test_empty_chain(self):
         """Test empty filter chain."""
         chain = FilterChain([])